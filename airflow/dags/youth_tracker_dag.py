@@ -5,11 +5,8 @@ from datetime import datetime, timedelta
 from airflow import DAG
 from airflow.operators.python import PythonOperator
 
-from pipeline.etl_pipeline import run_etl_pipeline
-from load.database_loader import DatabaseLoader
-from transform.data_transformer import transform_data
-from extract.csv_extractor import extract_data
-from transform.data_cleaner import clean_data
+# Pipeline modules (pandas, sqlalchemy) are imported inside the task callables
+# so the scheduler's DAG parsing loop only pays for Airflow itself.
 
 default_args = {
     'owner': 'youth_tracker',
@@ -31,19 +28,32 @@ dag = DAG(
 )
 
 def run_etl():
+    from pipeline.etl_pipeline import run_etl_pipeline
+
     success = run_etl_pipeline()
     if not success:
         raise Exception("ETL pipeline failed")
 
 def load_to_warehouse():
+    from extract.csv_extractor import extract_data
+    from transform.data_cleaner import clean_data
+    from transform.data_transformer import transform_data
+    from transform.key_encoder import encode_keys
+    from transform.rollup_builder import build_rollups
+    from load.database_loader import DatabaseLoader
+
     raw_data = extract_data()
-    cleaned_data = clean_data(raw_data)
+    # Encoded up front so the cohort and province dimensions carry their keys
+    cleaned_data = encode_keys(clean_data(raw_data))
     transformed_data = transform_data(cleaned_data)
+    transformed_data.update(build_rollups(transformed_data))
     
     loader = DatabaseLoader()
-    loader.load_to_warehouse(transformed_data)
+    loader.load_to_warehouse(transformed_data, cleaned_data)
 
 def generate_reports():
+    from load.database_loader import DatabaseLoader
+
     loader = DatabaseLoader()
     loader.connect()
     placement_report = loader.execute_query("""
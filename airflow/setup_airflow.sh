@@ -3,6 +3,7 @@ set -e
 
 echo "Creating necessary directories..."
 mkdir -p /opt/airflow/data/outputs
+mkdir -p /opt/airflow/data/keys /opt/airflow/data/rollups
 mkdir -p /opt/airflow/logs
 mkdir -p /opt/airflow/dags
 echo "Directories created successfully"
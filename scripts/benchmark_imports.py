@@ -0,0 +1,93 @@
+import sys
+import os
+import argparse
+import csv
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+DAG_FILE = ROOT / "airflow" / "dags" / "youth_tracker_dag.py"
+
+# What gets imported when the CLI starts and when the scheduler parses the DAG
+TARGETS = {
+    "cli": "import pipeline.etl_pipeline, utils.logger",
+    "dag": f"import runpy; runpy.run_path({str(DAG_FILE)!r})",
+}
+
+def measure_import_time(statement):
+    """
+    Run a statement in a fresh interpreter with -X importtime and return
+    (total import time in ms, the slowest top-level imports)
+    """
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, env=env, cwd=SRC
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    # Lines look like "import time:  self [us] | cumulative | imported package";
+    # top-level imports are the ones whose package name is not indented
+    top_level = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, package = line[len("import time:"):].split("|")
+        if not package.startswith("  "):
+            top_level.append((int(cumulative), package.strip()))
+
+    total_ms = sum(us for us, _ in top_level) / 1000
+    slowest = sorted(top_level, reverse=True)[:5]
+    return total_ms, slowest
+
+def git_revision():
+    """Short hash of the checked-out commit, so a measurement can be matched to the code it timed"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def main():
+    parser = argparse.ArgumentParser(description="Track CLI startup and DAG parse import times")
+    parser.add_argument("--output", default=str(ROOT / "benchmarks" / "import_times.csv"),
+                        help="CSV file the measurements are appended to")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Exit non-zero if any target exceeds this budget")
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    new_file = not output.exists()
+
+    over_budget = False
+    revision = git_revision()
+    with open(output, "a", newline="") as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(["timestamp", "revision", "target", "total_ms", "slowest_imports"])
+
+        for target, statement in TARGETS.items():
+            try:
+                total_ms, slowest = measure_import_time(statement)
+            except RuntimeError as e:
+                print(f"{target}: skipped ({e})")
+                continue
+
+            slowest_desc = "; ".join(f"{name}={us / 1000:.1f}ms" for us, name in slowest)
+            print(f"{target}: {total_ms:.1f} ms ({slowest_desc})")
+            writer.writerow([datetime.now().isoformat(timespec="seconds"), revision, target,
+                             f"{total_ms:.1f}", slowest_desc])
+
+            if args.max_ms is not None and total_ms > args.max_ms:
+                over_budget = True
+
+    if over_budget:
+        print(f"Import time budget of {args.max_ms} ms exceeded")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
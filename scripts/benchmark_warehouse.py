@@ -0,0 +1,307 @@
+import sys
+import os
+import argparse
+import json
+import shutil
+import socket
+import statistics
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+from load.database_loader import DatabaseLoader
+from transform.data_transformer import transform_data
+from transform.key_encoder import encode_keys
+from transform.rollup_builder import build_rollups
+from utils.helpers import get_project_root
+
+ROOT = get_project_root()
+SCHEMA_DIR = ROOT / "sql" / "schema"
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "warehouse_results.jsonl"
+DEFAULT_SCALES = [1000, 10000, 100000]
+# Cohorts are program intakes, not a share of the candidates: a fixed count
+# keeps the rollup cubes small relative to the fact tables, as in production
+BENCHMARK_COHORTS = 40
+QUERY_REPEATS = 5
+
+# Queries the dashboards and the DAG's generate_reports task run
+DASHBOARD_QUERIES = {
+    'placement_rates': """
+        SELECT cohort_name, region, placement_rate
+        FROM mv_placement_rates
+        ORDER BY placement_rate DESC
+    """,
+    'cohort_performance': "SELECT * FROM mv_cohort_performance",
+}
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+@contextmanager
+def throwaway_postgres():
+    """
+    Start a private PostgreSQL server in a temporary directory and yield its
+    connection URL. Needs initdb/pg_ctl on PATH (or in PG_BIN).
+    """
+    bin_dir = os.getenv("PG_BIN")
+    initdb = shutil.which("initdb", path=bin_dir)
+    pg_ctl = shutil.which("pg_ctl", path=bin_dir)
+    if not initdb or not pg_ctl:
+        raise RuntimeError("initdb/pg_ctl not found; install PostgreSQL, set PG_BIN, or pass --dsn")
+
+    work_dir = Path(tempfile.mkdtemp(prefix="warehouse_bench_"))
+    data_dir = work_dir / "data"
+    port = _free_port()
+    try:
+        subprocess.run([initdb, "-D", str(data_dir), "-U", "postgres", "-A", "trust", "--no-sync"],
+                       check=True, capture_output=True)
+        subprocess.run([pg_ctl, "-D", str(data_dir), "-l", str(work_dir / "server.log"), "-w", "start",
+                        "-o", f"-p {port} -k {work_dir} -c listen_addresses=localhost -c fsync=off"],
+                       check=True, capture_output=True)
+    except subprocess.CalledProcessError as e:
+        # initdb refuses to run as root, among other things worth surfacing
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise RuntimeError(f"Could not start PostgreSQL: {e.stderr.decode().strip()}") from e
+    try:
+        yield f"postgresql+psycopg2://postgres@localhost:{port}/postgres"
+    finally:
+        subprocess.run([pg_ctl, "-D", str(data_dir), "-m", "immediate", "stop"], capture_output=True)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+@contextmanager
+def scratch_database(server_url):
+    """Create an empty database with sql/schema applied, and drop it afterwards"""
+    db_name = f"warehouse_bench_{os.getpid()}_{int(time.time())}"
+    admin = create_engine(server_url, isolation_level="AUTOCOMMIT")
+    with admin.connect() as conn:
+        conn.execute(text(f'CREATE DATABASE "{db_name}"'))
+
+    url = make_url(server_url).set(database=db_name).render_as_string(hide_password=False)
+    engine = create_engine(url)
+    try:
+        # Raw DBAPI cursor so plpgsql bodies and '%' patterns are sent verbatim
+        raw = engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            for schema_file in sorted(SCHEMA_DIR.glob("*.sql")):
+                cursor.execute(schema_file.read_text())
+            raw.commit()
+        finally:
+            raw.close()
+        yield url
+    finally:
+        engine.dispose()
+        with admin.connect() as conn:
+            conn.execute(text(f'DROP DATABASE IF EXISTS "{db_name}" WITH (FORCE)'))
+        admin.dispose()
+
+def generate_cleaned_data(n_candidates, seed=42):
+    """Synthetic cleaned datasets shaped like the output of clean_data"""
+    rng = np.random.default_rng(seed)
+    n_cohorts = BENCHMARK_COHORTS
+    n_teams = max(n_candidates // 5, 1)
+    n_placements = int(n_candidates * 0.4)
+    n_courses = n_candidates * 2
+    enrollment = pd.Timestamp("2025-01-15")
+
+    cohort_ids = [f"COH{i:06d}" for i in range(1, n_cohorts + 1)]
+    team_ids = [f"TM{i:06d}" for i in range(1, n_teams + 1)]
+    province_ids = [f"PROV{i:03d}" for i in range(1, 10)]
+    candidate_ids = np.array([f"CAN{i:07d}" for i in range(1, n_candidates + 1)])
+
+    candidates = pd.DataFrame({
+        'CandidateID': candidate_ids,
+        'FirstName': 'First' + pd.Series(range(n_candidates)).astype(str),
+        'LastName': 'Last' + pd.Series(range(n_candidates)).astype(str),
+        'Gender': rng.choice(['Male', 'Female'], n_candidates),
+        'Age': rng.integers(18, 36, n_candidates),
+        'Email': [f"user{i}@capaciti.org.za" for i in range(n_candidates)],
+        'PhoneNumber': rng.integers(600000000, 899999999, n_candidates).astype(str),
+        'TeamID': rng.choice(team_ids, n_candidates),
+        'CohortID': rng.choice(cohort_ids, n_candidates),
+        'ProvinceID': rng.choice(province_ids, n_candidates),
+        'BranchID': 'BR001',
+        'EnrollmentDate': enrollment,
+    })
+    cohorts = pd.DataFrame({
+        'CohortID': cohort_ids,
+        'CohortName': [f"Cohort {i}" for i in range(1, n_cohorts + 1)],
+        'StartDate': enrollment,
+        'EndDate': enrollment + pd.Timedelta(days=150),
+    })
+    placements = pd.DataFrame({
+        'PlacementID': [f"PLAC{i:07d}" for i in range(1, n_placements + 1)],
+        'CandidateID': rng.choice(candidate_ids, n_placements),
+        'PlacementStatus': rng.choice(['Placed', 'Not Placed'], n_placements, p=[0.8, 0.2]),
+        'CompanyName': rng.choice(['TechCorp Solutions', 'DataVision Analytics', 'CloudNine'], n_placements),
+        'Position': 'Junior Developer',
+        'StartDate': enrollment + pd.Timedelta(days=170),
+    })
+    completed = rng.random(n_courses) < 0.5
+    coursera = pd.DataFrame({
+        'ProgressID': [f"PROG{i:07d}" for i in range(1, n_courses + 1)],
+        'CandidateID': rng.choice(candidate_ids, n_courses),
+        'CourseName': rng.choice(['Machine Learning Fundamentals', 'Python for Data Science', 'Cloud Basics'], n_courses),
+        'CompletionPercentage': np.where(completed, 100, rng.integers(0, 100, n_courses)),
+        'DateCompleted': pd.Series(enrollment + pd.Timedelta(days=30), index=range(n_courses)).where(completed),
+        'Status': np.where(completed, 'Completed', 'In Progress'),
+    })
+    teams = pd.DataFrame({
+        'TeamID': team_ids,
+        'TeamName': [f"Team {i}" for i in range(1, n_teams + 1)],
+        'CohortID': rng.choice(cohort_ids, n_teams),
+        'ProvinceID': rng.choice(province_ids, n_teams),
+    })
+    scrums = pd.DataFrame({
+        'ScrumID': [f"SCR{i:07d}" for i in range(1, n_teams * 2 + 1)],
+        'TeamID': rng.choice(team_ids, n_teams * 2),
+        'SessionDate': enrollment,
+    })
+    projects = pd.DataFrame({
+        'ProjectID': [f"PROJ{i:07d}" for i in range(1, n_teams + 1)],
+        'TeamID': rng.choice(team_ids, n_teams),
+    })
+    provinces = pd.DataFrame({
+        'ProvinceID': province_ids,
+        'ProvinceName': [f"Province {i}" for i in range(1, len(province_ids) + 1)],
+    })
+
+    return {
+        'candidates': candidates, 'cohorts': cohorts, 'placements': placements, 'coursera': coursera,
+        'teams': teams, 'scrums': scrums, 'projects': projects, 'provinces': provinces,
+    }
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+def benchmark_scale(server_url, n_candidates):
+    """Load one synthetic dataset into a fresh warehouse and measure it"""
+    with tempfile.TemporaryDirectory() as state_dir:
+        cleaned = encode_keys(generate_cleaned_data(n_candidates), key_dir=Path(state_dir) / "keys")
+        transformed = transform_data(cleaned)
+        transformed.update(build_rollups(transformed, cache_dir=Path(state_dir) / "rollups"))
+
+    rows = {
+        'dimensions': len(transformed['enhanced_candidates']),
+        'facts': len(transformed['placement_analysis']) + len(transformed['coursera_analysis']),
+        'rollups': len(transformed['placement_cube']) + len(transformed['completion_cube']),
+    }
+
+    with scratch_database(server_url) as url:
+        loader = DatabaseLoader(connection_string=url)
+        loader.connect()
+        try:
+            timings = {
+                'dimensions': _timed(lambda: loader._load_dimensions(transformed, cleaned)),
+                'facts': _timed(lambda: loader._load_facts(transformed)),
+                'rollups': _timed(lambda: loader._load_rollups(transformed)),
+            }
+            refresh_seconds = _timed(loader._refresh_views)
+
+            queries = {}
+            with loader.engine.connect() as conn:
+                for name, query in DASHBOARD_QUERIES.items():
+                    samples = [_timed(lambda: conn.execute(text(query)).fetchall()) for _ in range(QUERY_REPEATS)]
+                    queries[name] = {
+                        'median_ms': round(statistics.median(samples) * 1000, 3),
+                        'max_ms': round(max(samples) * 1000, 3),
+                    }
+        finally:
+            loader.engine.dispose()
+
+    return {
+        'candidates': n_candidates,
+        'load': {
+            stage: {
+                'rows': rows[stage],
+                'seconds': round(seconds, 4),
+                'rows_per_sec': round(rows[stage] / seconds, 1) if seconds else None,
+            }
+            for stage, seconds in timings.items()
+        },
+        'view_refresh_seconds': round(refresh_seconds, 4),
+        'queries': queries,
+    }
+
+def _git_revision():
+    """Short hash of the checked-out commit, with "-dirty" if tracked files were modified"""
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty", "--abbrev=7"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _previous_result(output):
+    if not output.exists():
+        return None
+    lines = output.read_text().strip().splitlines()
+    return json.loads(lines[-1]) if lines else None
+
+def _report(result, previous):
+    """Print this run and the change against the previous saved run"""
+    previous_scales = {s['candidates']: s for s in previous['scales']} if previous else {}
+
+    def delta(new, old):
+        return f" ({(new - old) / old * 100:+.1f}%)" if old else ""
+
+    for scale in result['scales']:
+        before = previous_scales.get(scale['candidates'], {})
+        print(f"\n{scale['candidates']} candidates")
+        for stage, m in scale['load'].items():
+            old = before.get('load', {}).get(stage, {}).get('rows_per_sec')
+            print(f"  load {stage:<11} {m['rows']:>9} rows  {m['rows_per_sec']} rows/s{delta(m['rows_per_sec'], old)}")
+        old = before.get('view_refresh_seconds')
+        print(f"  view refresh     {scale['view_refresh_seconds']} s{delta(scale['view_refresh_seconds'], old)}")
+        for name, m in scale['queries'].items():
+            old = before.get('queries', {}).get(name, {}).get('median_ms')
+            print(f"  query {name:<26} {m['median_ms']} ms{delta(m['median_ms'], old)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DatabaseLoader and dashboard queries at several data scales")
+    parser.add_argument("--dsn", default=None,
+                        help="SQLAlchemy URL of an existing PostgreSQL server to create scratch databases on "
+                             "(default: start a throwaway local server with initdb)")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help="Numbers of synthetic candidates to load")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT),
+                        help="JSON-lines file each run's results are appended to")
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    previous = _previous_result(output)
+
+    server = nullcontext(args.dsn) if args.dsn else throwaway_postgres()
+    with server as server_url:
+        scales = []
+        for n in args.scales:
+            print(f"Benchmarking {n} candidates...")
+            scales.append(benchmark_scale(server_url, n))
+
+    result = {
+        'timestamp': datetime.now().isoformat(timespec="seconds"),
+        'revision': _git_revision(),
+        'scales': scales,
+    }
+    _report(result, previous)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "a") as f:
+        f.write(json.dumps(result) + "\n")
+    print(f"\nResults appended to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,12 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 
 from pipeline.etl_pipeline import run_etl_pipeline
 from utils.logger import setup_logging
+from utils.metrics import setup_metrics
 
 def main():
     """Main function to run the ETL pipeline"""
     setup_logging()
+    setup_metrics()
     print("Starting Youth Employment Tracker ETL Pipeline...")
     
     success = run_etl_pipeline()
@@ -0,0 +1,34 @@
+-- Upgrade a warehouse created before integer surrogate keys (and before the
+-- rollup tables) to the current sql/schema.
+--
+-- docker-entrypoint-initdb.d only applies sql/schema to an empty volume, so an
+-- existing warehouse has to be migrated by hand:
+--
+--   psql -v ON_ERROR_STOP=1 -U postgres -d youth_employment -f sql/migrations/001_integer_surrogate_keys.sql
+--
+-- then re-run the load_to_warehouse task. Every table the ETL loads is
+-- truncated and reloaded on each run, so those tables are dropped and
+-- recreated rather than altered in place. dim_programs is not loaded by the
+-- ETL and keeps its rows.
+
+BEGIN;
+
+DROP VIEW IF EXISTS v_placement_rates_rollup, v_cohort_performance_rollup;
+DROP TABLE IF EXISTS agg_placement_cube, agg_completion_cube;
+DROP MATERIALIZED VIEW IF EXISTS mv_placement_rates, mv_cohort_performance;
+DROP FUNCTION IF EXISTS refresh_materialized_views();
+DROP TABLE IF EXISTS fact_placements, fact_coursera, fact_scrums, fact_projects;
+DROP TABLE IF EXISTS dim_candidates, dim_cohorts, dim_teams, dim_provinces;
+
+CREATE TEMPORARY TABLE dim_programs_backup AS SELECT * FROM dim_programs;
+DROP TABLE dim_programs;
+
+\ir ../schema/01_star_schema.sql
+\ir ../schema/02_rollup_tables.sql
+\ir ../schema/03_materialized_views.sql
+
+INSERT INTO dim_programs SELECT * FROM dim_programs_backup;
+SELECT setval(pg_get_serial_sequence('dim_programs', 'program_id'), COALESCE(MAX(program_id), 0) + 1, false)
+FROM dim_programs;
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- Upgrade a warehouse that already has the rollup cubes (agg_placement_cube,
+-- agg_completion_cube) to dashboard views materialized from those cubes:
+--
+--   psql -v ON_ERROR_STOP=1 -U postgres -d youth_employment -f sql/migrations/002_materialized_rollup_summaries.sql
+--
+-- mv_placement_rates and mv_cohort_performance keep their names and columns,
+-- so Power BI reports are unaffected. The plain v_*_rollup views are replaced
+-- by them. No table is touched; the new views are populated from the current cubes.
+
+BEGIN;
+
+DROP VIEW IF EXISTS v_placement_rates_rollup, v_cohort_performance_rollup;
+DROP MATERIALIZED VIEW IF EXISTS mv_placement_rates, mv_cohort_performance;
+DROP FUNCTION IF EXISTS refresh_materialized_views();
+
+\ir ../schema/03_materialized_views.sql
+
+COMMIT;
@@ -1,21 +1,26 @@
 -- Dimension Tables
+-- Every dimension has an integer surrogate key (assigned by transform/key_encoder.py)
+-- as its primary key and keeps its natural key as a unique column; facts and
+-- other dimensions reference dimensions by surrogate key only.
 CREATE TABLE dim_candidates (
-    candidate_id VARCHAR(50) PRIMARY KEY,
+    candidate_key INTEGER PRIMARY KEY,
+    candidate_id VARCHAR(50) UNIQUE NOT NULL,
     first_name VARCHAR(100),
     last_name VARCHAR(100),
     email VARCHAR(150),
     gender VARCHAR(20),
     age INTEGER,
     age_group VARCHAR(20),
-    province_id VARCHAR(50),
-    cohort_id VARCHAR(50),
-    team_id VARCHAR(50),
+    province_key INTEGER,
+    cohort_key INTEGER,
+    team_key INTEGER,
     enrollment_date DATE,
     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE TABLE dim_cohorts (
-    cohort_id VARCHAR(50) PRIMARY KEY,
+    cohort_key INTEGER PRIMARY KEY,
+    cohort_id VARCHAR(50) UNIQUE NOT NULL,
     cohort_name VARCHAR(100),
     start_date DATE,
     end_date DATE,
@@ -23,14 +28,16 @@ CREATE TABLE dim_cohorts (
 );
 
 CREATE TABLE dim_teams (
-    team_id VARCHAR(50) PRIMARY KEY,
+    team_key INTEGER PRIMARY KEY,
+    team_id VARCHAR(50) UNIQUE NOT NULL,
     team_name VARCHAR(100),
-    cohort_id VARCHAR(50),
+    cohort_key INTEGER,
     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE TABLE dim_provinces (
-    province_id VARCHAR(50) PRIMARY KEY,
+    province_key INTEGER PRIMARY KEY,
+    province_id VARCHAR(50) UNIQUE NOT NULL,
     province_name VARCHAR(100),
     region VARCHAR(50),
     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -46,38 +53,38 @@ CREATE TABLE dim_programs (
 -- Fact Tables
 CREATE TABLE fact_placements (
     placement_id VARCHAR(50) PRIMARY KEY,
-    candidate_id VARCHAR(50) REFERENCES dim_candidates(candidate_id),
+    candidate_key INTEGER REFERENCES dim_candidates(candidate_key),
     company_name VARCHAR(100),
     placement_status VARCHAR(50),
     gender VARCHAR(20),
-    province_id VARCHAR(50),
-    cohort_id VARCHAR(50),
+    province_key INTEGER,
+    cohort_key INTEGER,
     start_date DATE,
     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE TABLE fact_coursera (
     progress_id VARCHAR(50) PRIMARY KEY,
-    candidate_id VARCHAR(50) REFERENCES dim_candidates(candidate_id),
+    candidate_key INTEGER REFERENCES dim_candidates(candidate_key),
     course_name VARCHAR(150),
     completion_status VARCHAR(50),
     gender VARCHAR(20),
     age INTEGER,
     date_completed DATE,
-    cohort_id VARCHAR(50),
+    cohort_key INTEGER,
     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE TABLE fact_scrums (
     scrum_id VARCHAR(50) PRIMARY KEY,
-    team_id VARCHAR(50) REFERENCES dim_teams(team_id),
+    team_key INTEGER REFERENCES dim_teams(team_key),
     session_date DATE,
     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE TABLE fact_projects (
     project_id VARCHAR(50) PRIMARY KEY,
-    team_id VARCHAR(50) REFERENCES dim_teams(team_id),
+    team_key INTEGER REFERENCES dim_teams(team_key),
     project_name VARCHAR(100),
     evaluation_score VARCHAR(100),
     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -0,0 +1,25 @@
+-- Pre-aggregated rollup cubes (built by transform/rollup_builder.py)
+-- Grain: cohort x province x gender x age group. Every measure is additive,
+-- so the dashboard views can SUM them up to any coarser level without distinct counts.
+CREATE TABLE agg_placement_cube (
+    cohort_key INTEGER NOT NULL,
+    province_key INTEGER NOT NULL,
+    gender VARCHAR(20) NOT NULL,
+    age_group VARCHAR(20) NOT NULL,
+    total_candidates INTEGER NOT NULL,
+    placed_candidates INTEGER NOT NULL,
+    total_placements INTEGER NOT NULL,
+    PRIMARY KEY (cohort_key, province_key, gender, age_group)
+);
+
+CREATE TABLE agg_completion_cube (
+    cohort_key INTEGER NOT NULL,
+    province_key INTEGER NOT NULL,
+    gender VARCHAR(20) NOT NULL,
+    age_group VARCHAR(20) NOT NULL,
+    total_candidates INTEGER NOT NULL,
+    candidates_with_courses INTEGER NOT NULL,
+    course_enrollments INTEGER NOT NULL,
+    course_completions INTEGER NOT NULL,
+    PRIMARY KEY (cohort_key, province_key, gender, age_group)
+);
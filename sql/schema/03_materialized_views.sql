@@ -0,0 +1,49 @@
+-- Dashboard summaries, materialized from the rollup cubes in 02_rollup_tables.sql.
+-- The cubes already count distinct candidates per cohort x province x gender x
+-- age group (placed = same rule as SUCCESSFUL_PLACEMENT_PATTERN in
+-- transform/report_generator.py), so refreshing these only sums small tables.
+CREATE MATERIALIZED VIEW mv_placement_rates AS
+SELECT
+    ch.cohort_id,
+    ch.cohort_name,
+    p.region,
+    SUM(c.total_candidates) AS total_candidates,
+    SUM(c.placed_candidates) AS placed_candidates,
+    ROUND(
+        SUM(c.placed_candidates) * 100.0 / NULLIF(SUM(c.total_candidates), 0), 2
+    ) AS placement_rate
+FROM agg_placement_cube c
+JOIN dim_cohorts ch ON c.cohort_key = ch.cohort_key
+JOIN dim_provinces p ON c.province_key = p.province_key
+GROUP BY ch.cohort_key, ch.cohort_id, ch.cohort_name, p.region;
+
+-- Cohort performance summary; every cohort is listed, including those without candidates
+CREATE MATERIALIZED VIEW mv_cohort_performance AS
+SELECT
+    ch.cohort_id,
+    ch.cohort_name,
+    COALESCE(pc.total_candidates, 0) AS total_candidates,
+    COALESCE(pc.placed_candidates, 0) AS placed_candidates,
+    COALESCE(cc.candidates_with_courses, 0) AS candidates_with_courses,
+    COALESCE(cc.course_enrollments, 0) AS total_course_completions
+
+FROM dim_cohorts ch
+LEFT JOIN (
+    SELECT cohort_key, SUM(total_candidates) AS total_candidates, SUM(placed_candidates) AS placed_candidates
+    FROM agg_placement_cube
+    GROUP BY cohort_key
+) pc ON ch.cohort_key = pc.cohort_key
+LEFT JOIN (
+    SELECT cohort_key, SUM(candidates_with_courses) AS candidates_with_courses, SUM(course_enrollments) AS course_enrollments
+    FROM agg_completion_cube
+    GROUP BY cohort_key
+) cc ON ch.cohort_key = cc.cohort_key;
+
+-- Refresh function
+CREATE OR REPLACE FUNCTION refresh_materialized_views()
+RETURNS void AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW mv_placement_rates;
+    REFRESH MATERIALIZED VIEW mv_cohort_performance;
+END;
+$$ LANGUAGE plpgsql;
\ No newline at end of file
@@ -2,10 +2,23 @@ import pandas as pd
 import logging
 from pathlib import Path
 from utils.helpers import get_data_path
+from utils.metrics import get_metrics
 from extract.data_validator import validate_csv_data
 
 logger = logging.getLogger(__name__)
 
+# Dataset name -> file in data/raw
+DATA_FILES = {
+    "candidates": "Candidate.csv",
+    "cohorts": "Cohort.csv",
+    "coursera": "Coursera.csv",
+    "placements": "Placement.csv",
+    "teams": "Team.csv",
+    "provinces": "Province.csv",
+    "projects": "Project.csv",
+    "scrums": "Scrum.csv"
+}
+
 def read_csv_file(file_path, data_type):
     """Read a CSV file with robust error handling"""
     try:
@@ -13,64 +26,55 @@ def read_csv_file(file_path, data_type):
         df = pd.read_csv(file_path, on_bad_lines='skip', encoding='utf-8')
         
         if df.empty:
-            logger.warning(f"File {file_path} is empty or could not be read properly")
+            logger.warning("File %s is empty or could not be read properly", file_path)
             # Try alternative method
             df = pd.read_csv(file_path, error_bad_lines=False, warn_bad_lines=True, encoding='utf-8')
         
-        logger.info(f"Successfully read {file_path} with {len(df)} rows")
+        logger.info("Successfully read %s with %s rows", file_path, len(df))
         
         # Validate the data
         if validate_csv_data(df, data_type):
             return df
         else:
-            logger.warning(f"Validation failed for {data_type}, using raw data with warnings")
+            logger.warning("Validation failed for %s, using raw data with warnings", data_type)
             return df
             
     except Exception as e:
-        logger.error(f"Error reading {file_path}: {str(e)}")
+        logger.error("Error reading %s: %s", file_path, e)
         
         # Try alternative reading methods
         try:
-            logger.info(f"Trying alternative CSV reading method for {file_path}")
+            logger.info("Trying alternative CSV reading method for %s", file_path)
             df = pd.read_csv(file_path, sep=None, engine='python', encoding='utf-8')
-            logger.info(f"Alternative method successful: {len(df)} rows")
+            logger.info("Alternative method successful: %s rows", len(df))
             return df
         except Exception as e2:
-            logger.error(f"All reading methods failed for {file_path}: {str(e2)}")
+            logger.error("All reading methods failed for %s: %s", file_path, e2)
             raise
 
-def extract_data():
+def extract_data(raw_dir=None):
     """
     Extract data from all CSV files in the raw data directory
     """
-    data_path = get_data_path("raw")
-    data_files = {
-        "candidates": "Candidate.csv",
-        "cohorts": "Cohort.csv",
-        "coursera": "Coursera.csv",
-        "placements": "Placement.csv",
-        "teams": "Team.csv",
-        "provinces": "Province.csv",
-        "projects": "Project.csv",
-        "scrums": "Scrum.csv"
-    }
-    
+    data_path = raw_dir or get_data_path("raw")
     
     extracted_data = {}
+    metrics = get_metrics()
     
-    for data_name, filename in data_files.items():
+    for data_name, filename in DATA_FILES.items():
         file_path = Path(data_path) / filename
         if file_path.exists():
             try:
                 df = read_csv_file(file_path, data_name)
                 extracted_data[data_name] = df
-                logger.info(f"Successfully extracted {data_name} with {len(df)} rows")
+                metrics.increment('extract.rows', len(df), dataset=data_name)
+                logger.info("Successfully extracted %s with %s rows", data_name, len(df))
             except Exception as e:
-                logger.error(f"Failed to extract {data_name}: {str(e)}")
+                logger.error("Failed to extract %s: %s", data_name, e)
                 # Create empty DataFrame as fallback
                 extracted_data[data_name] = pd.DataFrame()
         else:
-            logger.warning(f"File not found: {file_path}")
+            logger.warning("File not found: %s", file_path)
             # Create empty DataFrame as fallback
             extracted_data[data_name] = pd.DataFrame()
     
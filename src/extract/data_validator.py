@@ -20,7 +20,7 @@ def validate_csv_data(df, data_type):
     Validate the structure and basic quality of CSV data
     """
     if data_type not in REQUIRED_COLUMNS:
-        logger.error(f"Unknown data type: {data_type}")
+        logger.error("Unknown data type: %s", data_type)
         return False
     
     # Check required columns
@@ -28,24 +28,24 @@ def validate_csv_data(df, data_type):
     missing_cols = [col for col in required_cols if col not in df.columns]
     
     if missing_cols:
-        logger.error(f"Missing required columns in {data_type}: {missing_cols}")
+        logger.error("Missing required columns in %s: %s", data_type, missing_cols)
         return False
     
     # Check for empty data
     if df.empty:
-        logger.warning(f"{data_type} DataFrame is empty")
+        logger.warning("%s DataFrame is empty", data_type)
         return True
     
     # Check for duplicate rows
     duplicates = df.duplicated().sum()
     if duplicates > 0:
-        logger.warning(f"Found {duplicates} duplicate rows in {data_type}")
+        logger.warning("Found %s duplicate rows in %s", duplicates, data_type)
     
     # Check for null values in key columns
     key_columns = required_cols[:2]  # First two columns are usually keys
     for col in key_columns:
         null_count = df[col].isnull().sum()
         if null_count > 0:
-            logger.warning(f"Found {null_count} null values in {col} column of {data_type}")
+            logger.warning("Found %s null values in %s column of %s", null_count, col, data_type)
     
     return True
\ No newline at end of file
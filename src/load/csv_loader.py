@@ -1,8 +1,9 @@
 import pandas as pd
 import logging
-import json
-from pathlib import Path
 from utils.helpers import get_data_path, ensure_directory_exists
+from load.output_writer import OutputWriter
+from transform.key_encoder import KEY_COLUMNS
+from transform.rollup_builder import ROLLUP_NAMES
 
 logger = logging.getLogger(__name__)
 
@@ -12,34 +13,31 @@ def save_outputs(transformed_data, reports):
     """
     output_path = get_data_path("outputs")
     ensure_directory_exists(output_path)
+    writer = OutputWriter(output_path)
     
-    # Save transformed datasets
+    # Save transformed datasets; the rollup cubes only hold surrogate keys and
+    # are loaded to the warehouse instead
     for name, data in transformed_data.items():
+        if name in ROLLUP_NAMES:
+            continue
         if isinstance(data, pd.DataFrame):
-            file_path = output_path / f"{name}.csv"
-            data.to_csv(file_path, index=False)
-            logger.info(f"Saved {name} to {file_path}")
+            # Surrogate keys are internal to the pipeline and warehouse; the
+            # CSV outputs keep their natural-key layout
+            writer.add_csv(f"{name}.csv", data.drop(columns=KEY_COLUMNS, errors='ignore'), index=False)
     
     # Save reports
     for report_name, report_data in reports.items():
         if report_name == 'program_summary':
             # Save as JSON for easy reading
-            file_path = output_path / f"{report_name}.json"
-            with open(file_path, 'w') as f:
-                json.dump(report_data, f, indent=2, default=str)
-            logger.info(f"Saved {report_name} to {file_path}")
+            writer.add_json(f"{report_name}.json", report_data, default=str)
         elif isinstance(report_data, dict):
             # Save detailed analytics
             for sub_name, sub_data in report_data.items():
                 if isinstance(sub_data, pd.DataFrame):
-                    file_path = output_path / f"{report_name}_{sub_name}.csv"
-                    sub_data.to_csv(file_path, index=True)
-                    logger.info(f"Saved {report_name}_{sub_name} to {file_path}")
+                    writer.add_csv(f"{report_name}_{sub_name}.csv", sub_data, index=True)
                 elif hasattr(sub_data, 'to_dict'):
                     # Handle pandas Series
-                    file_path = output_path / f"{report_name}_{sub_name}.json"
-                    with open(file_path, 'w') as f:
-                        json.dump(sub_data.to_dict(), f, indent=2)
-                    logger.info(f"Saved {report_name}_{sub_name} to {file_path}")
+                    writer.add_json(f"{report_name}_{sub_name}.json", sub_data.to_dict())
     
-    logger.info(f"All outputs saved to {output_path}")
\ No newline at end of file
+    writer.write_all()
+    logger.info("All outputs saved to %s", output_path)
@@ -1,14 +1,34 @@
+import csv
+import io
 import logging
 import pandas as pd
 from sqlalchemy import create_engine, text
 from utils.helpers import get_db_connection_string
+from transform.key_encoder import UNKNOWN_KEY
+from transform.rollup_builder import UNKNOWN_MEMBER
 
 logger = logging.getLogger(__name__)
 
+ROLLUP_TABLES = {
+    'placement_cube': 'agg_placement_cube',
+    'completion_cube': 'agg_completion_cube',
+}
+
+def copy_insert(table, conn, keys, data_iter):
+    """to_sql insert method that bulk loads rows with PostgreSQL COPY"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+
+    columns = ', '.join(f'"{key}"' for key in keys)
+    table_name = f'{table.schema}.{table.name}' if table.schema else table.name
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN WITH CSV", buffer)
+
 class DatabaseLoader:
-    def __init__(self):
+    def __init__(self, connection_string=None):
         self.engine = None
-        self.connection_string = get_db_connection_string()
+        self.connection_string = connection_string or get_db_connection_string()
     
     def connect(self):
         """Establish database connection"""
@@ -17,21 +37,27 @@ class DatabaseLoader:
             logger.info("Database connection established")
             return True
         except Exception as e:
-            logger.error(f"Database connection failed: {e}")
+            logger.error("Database connection failed: %s", e)
             return False
     
-    def load_to_warehouse(self, transformed_data):
-        """Load transformed data into data warehouse"""
+    def load_to_warehouse(self, transformed_data, cleaned_data=None):
+        """
+        Load transformed data into data warehouse. cleaned_data (after
+        encode_keys) supplies the cohort and province dimensions.
+        """
         if not self.connect():
             return False
         
         try:
             # Load dimension tables first
-            self._load_dimensions(transformed_data)
+            self._load_dimensions(transformed_data, cleaned_data)
             
             # Load fact tables
             self._load_facts(transformed_data)
             
+            # Load pre-aggregated rollup cubes
+            self._load_rollups(transformed_data)
+            
             # Refresh materialized views
             self._refresh_views()
             
@@ -39,18 +65,19 @@ class DatabaseLoader:
             return True
             
         except Exception as e:
-            logger.error(f"Database loading failed: {e}")
+            logger.error("Database loading failed: %s", e)
             return False
     
-    def _load_dimensions(self, data):
+    def _load_dimensions(self, data, cleaned_data=None):
         """Load dimension tables"""
         
         # Load dim_candidates
         if 'enhanced_candidates' in data:
             candidates_df = data['enhanced_candidates'][[
-                'CandidateID', 'FirstName', 'LastName', 'Email', 'Gender', 
-                'Age', 'AgeGroup', 'ProvinceID', 'CohortID', 'TeamID', 'EnrollmentDate'
+                'CandidateKey', 'CandidateID', 'FirstName', 'LastName', 'Email', 'Gender', 
+                'Age', 'AgeGroup', 'ProvinceKey', 'CohortKey', 'TeamKey', 'EnrollmentDate'
             ]].rename(columns={
+                'CandidateKey': 'candidate_key',
                 'CandidateID': 'candidate_id',
                 'FirstName': 'first_name', 
                 'LastName': 'last_name',
@@ -58,9 +85,9 @@ class DatabaseLoader:
                 'Gender': 'gender',
                 'Age': 'age',
                 'AgeGroup': 'age_group',
-                'ProvinceID': 'province_id',
-                'CohortID': 'cohort_id',
-                'TeamID': 'team_id',
+                'ProvinceKey': 'province_key',
+                'CohortKey': 'cohort_key',
+                'TeamKey': 'team_key',
                 'EnrollmentDate': 'enrollment_date'
             })
             
@@ -68,66 +95,123 @@ class DatabaseLoader:
                 conn.execute(text("TRUNCATE TABLE dim_candidates RESTART IDENTITY CASCADE"))
             
             candidates_df.to_sql('dim_candidates', self.engine, if_exists='append', index=False)
-            logger.info(f"Loaded {len(candidates_df)} records to dim_candidates")
-    
+            logger.info("Loaded %s records to dim_candidates", len(candidates_df))
+        
+        if cleaned_data is None:
+            logger.warning("No cleaned data given, dim_cohorts and dim_provinces were not loaded")
+            return
+        
+        # Load dim_cohorts and dim_provinces so surrogate keys resolve to natural keys
+        dimensions = []
+        if 'cohorts' in cleaned_data:
+            dimensions.append(('dim_cohorts', cleaned_data['cohorts'], {
+                'CohortKey': 'cohort_key',
+                'CohortID': 'cohort_id',
+                'CohortName': 'cohort_name',
+                'StartDate': 'start_date',
+                'EndDate': 'end_date'
+            }))
+        if 'provinces' in cleaned_data:
+            dimensions.append(('dim_provinces', cleaned_data['provinces'], {
+                'ProvinceKey': 'province_key',
+                'ProvinceID': 'province_id',
+                'ProvinceName': 'province_name'
+            }))
+        
+        for table, df, columns in dimensions:
+            key = next(iter(columns))
+            # Rows with a blank natural key have no surrogate key to store
+            dim_df = df[[c for c in columns if c in df.columns]].dropna(subset=[key])
+            dim_df = dim_df.drop_duplicates(subset=[key]).rename(columns=columns)
+            
+            # Unknown member for cube rows filed under UNKNOWN_KEY
+            key_column, id_column, name_column = list(columns.values())[:3]
+            unknown = pd.DataFrame({key_column: [UNKNOWN_KEY], id_column: [UNKNOWN_MEMBER], name_column: [UNKNOWN_MEMBER]})
+            dim_df = pd.concat([unknown, dim_df], ignore_index=True)
+            
+            with self.engine.begin() as conn:
+                conn.execute(text(f"TRUNCATE TABLE {table} RESTART IDENTITY CASCADE"))
+            
+            dim_df.to_sql(table, self.engine, if_exists='append', index=False)
+            logger.info("Loaded %s records to %s", len(dim_df), table)
+
     def _load_facts(self, data):
         """Load fact tables"""
         
         # Load fact_placements
         if 'placement_analysis' in data:
             placements_df = data['placement_analysis'][[
-                'PlacementID', 'CandidateID', 'CompanyName', 'PlacementStatus', 'StartDate', 'Gender', 'CohortID', 'ProvinceID'
+                'PlacementID', 'CandidateKey', 'CompanyName', 'PlacementStatus', 'StartDate', 'Gender', 'CohortKey', 'ProvinceKey'
             ]].copy()
             
             placements_df = placements_df.rename(columns={
                 'PlacementID': 'placement_id',
-                'CandidateID': 'candidate_id',
+                'CandidateKey': 'candidate_key',
                 'CompanyName': 'company_name',
                 'PlacementStatus': 'placement_status',
                 'StartDate': 'start_date',
                 'Gender':'gender',
-                'ProvinceID': 'province_id',
-                'CohortID':'cohort_id'
+                'ProvinceKey': 'province_key',
+                'CohortKey':'cohort_key'
             })
             
             with self.engine.begin() as conn:
                 conn.execute(text("TRUNCATE TABLE fact_placements RESTART IDENTITY CASCADE"))
             
             placements_df.to_sql('fact_placements', self.engine, if_exists='append', index=False)
-            logger.info(f"Loaded {len(placements_df)} records to fact_placements")
+            logger.info("Loaded %s records to fact_placements", len(placements_df))
         
         # Load fact_coursera
         if 'coursera_analysis' in data:
             coursera_df = data['coursera_analysis'][[
-                'ProgressID', 'CandidateID', 'CourseName', 'DateCompleted', 'Status', 'Gender', 'Age', 'CohortID'
+                'ProgressID', 'CandidateKey', 'CourseName', 'DateCompleted', 'Status', 'Gender', 'Age', 'CohortKey'
             ]].copy()
             
             coursera_df = coursera_df.rename(columns={
                 'ProgressID': 'progress_id',
-                'CandidateID': 'candidate_id',
+                'CandidateKey': 'candidate_key',
                 'CourseName': 'course_name',
                 'DateCompleted': 'date_completed',
                 'Status':'completion_status',
                 'Gender':'gender',
                 'Age':'age',
-                'CohortID':'cohort_id'
+                'CohortKey':'cohort_key'
             })
             
             with self.engine.begin() as conn:
                 conn.execute(text("TRUNCATE TABLE fact_coursera RESTART IDENTITY CASCADE"))
             
             coursera_df.to_sql('fact_coursera', self.engine, if_exists='append', index=False)
-            logger.info(f"Loaded {len(coursera_df)} records to fact_coursera")
+            logger.info("Loaded %s records to fact_coursera", len(coursera_df))
+    
+    def _load_rollups(self, data):
+        """Replace the rollup summary tables with the freshly built cubes"""
+        for name, table in ROLLUP_TABLES.items():
+            if name not in data:
+                continue
+            
+            cube_df = data[name].rename(columns={
+                'CohortKey': 'cohort_key',
+                'ProvinceKey': 'province_key',
+                'Gender': 'gender',
+                'AgeGroup': 'age_group'
+            })
+            
+            # Truncate and COPY in one transaction so dashboards never see an empty cube
+            with self.engine.begin() as conn:
+                conn.execute(text(f"TRUNCATE TABLE {table}"))
+                cube_df.to_sql(table, conn, if_exists='append', index=False, method=copy_insert)
+            logger.info("Loaded %s records to %s", len(cube_df), table)
     
     def _refresh_views(self):
-        """Refresh materialized views"""
+        """Refresh the dashboard materialized views, which sum the freshly loaded rollup cubes"""
         try:
             with self.engine.begin() as conn:
                 conn.execute(text("REFRESH MATERIALIZED VIEW mv_placement_rates"))
                 conn.execute(text("REFRESH MATERIALIZED VIEW mv_cohort_performance"))
             logger.info("Materialized views refreshed")
         except Exception as e:
-            logger.warning(f"Could not refresh materialized views: {e}")
+            logger.warning("Could not refresh materialized views: %s", e)
     
     def execute_query(self, query):
         """Execute SQL query and return results"""
@@ -136,5 +220,5 @@ class DatabaseLoader:
                 result = conn.execute(text(query))
                 return result.fetchall()
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error("Query execution failed: %s", e)
             return []
\ No newline at end of file
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pandas as pd
+from utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = ".output_manifest.json"
+DEFAULT_WORKERS = int(os.getenv("OUTPUT_WRITER_WORKERS", "4"))
+CSV_CHUNK_ROWS = int(os.getenv("OUTPUT_CSV_CHUNK_ROWS", "50000"))
+
+def frame_fingerprint(df, index):
+    """Content hash of a DataFrame, covering columns, dtypes and (optionally) the index"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(c) for c in df.columns]).encode())
+    digest.update(json.dumps([str(t) for t in df.dtypes]).encode())
+    digest.update(str(index).encode())
+    if index:
+        digest.update(json.dumps([str(n) for n in df.index.names]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=index).values.tobytes())
+    return digest.hexdigest()
+
+def text_fingerprint(text):
+    """Content hash of an already serialized output"""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+class OutputWriter:
+    """
+    Writes output files concurrently on a thread pool.
+
+    Every file is written to a temporary file next to its target and renamed
+    into place, so a failed run never leaves half-written outputs behind.
+    Outputs whose content hash matches the previous run are not rewritten,
+    unless the file's size or mtime shows it was changed since (edited,
+    replaced or checked out again).
+    """
+
+    def __init__(self, output_path, max_workers=DEFAULT_WORKERS, chunk_rows=CSV_CHUNK_ROWS):
+        self.output_path = output_path
+        self.max_workers = max_workers
+        self.chunk_rows = chunk_rows
+        self._manifest_path = output_path / MANIFEST_FILE
+        self._previous = self._load_manifest()
+        self._jobs = []
+
+    def add_csv(self, filename, df, index=False):
+        """Queue a DataFrame to be written as CSV"""
+        self._jobs.append((filename, lambda: frame_fingerprint(df, index),
+                           lambda path: self._write_csv(path, df, index)))
+
+    def add_json(self, filename, data, **dump_kwargs):
+        """Queue a JSON-serializable object to be written"""
+        text = json.dumps(data, indent=2, **dump_kwargs)
+        self._jobs.append((filename, lambda: text_fingerprint(text),
+                           lambda path: self._write_text(path, text)))
+
+    def write_all(self):
+        """
+        Write every queued output and return the names of the files written.
+        Raises the first write error after all other writes have finished.
+        """
+        manifest = dict(self._previous)
+        written, skipped, errors = [], [], []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="output-writer") as pool:
+            futures = {pool.submit(self._run_job, *job): job[0] for job in self._jobs}
+            for future in as_completed(futures):
+                filename = futures[future]
+                try:
+                    entry, changed = future.result()
+                except Exception as e:
+                    logger.error("Failed to write %s: %s", filename, e)
+                    manifest.pop(filename, None)
+                    errors.append(e)
+                    continue
+
+                manifest[filename] = entry
+                if changed:
+                    written.append(filename)
+                    logger.info("Saved %s to %s", filename, self.output_path / filename)
+                else:
+                    skipped.append(filename)
+
+        self._jobs = []
+        self._save_manifest(manifest)
+        get_metrics().increment('outputs.written', len(written))
+        get_metrics().increment('outputs.unchanged', len(skipped))
+        logger.info("Wrote %s output files, %s unchanged since the previous run", len(written), len(skipped))
+
+        if errors:
+            raise errors[0]
+        return written
+
+    def _run_job(self, filename, fingerprint_fn, write_fn):
+        """
+        Write one output unless it is unchanged; returns (manifest entry, written).
+        An output is unchanged only if its content hash matches the previous run
+        and the file on disk is still the one that run wrote.
+        """
+        path = self.output_path / filename
+        fingerprint = fingerprint_fn()
+        # Manifests from before file sizes and mtimes were recorded hold plain fingerprints
+        previous = self._previous.get(filename)
+        if isinstance(previous, dict):
+            on_disk = self._file_state(path)
+            if previous['fingerprint'] == fingerprint and on_disk == (previous['size'], previous['mtime_ns']):
+                return previous, False
+
+        self._atomic_write(path, write_fn)
+        size, mtime_ns = self._file_state(path)
+        return {'fingerprint': fingerprint, 'size': size, 'mtime_ns': mtime_ns}, True
+
+    @staticmethod
+    def _file_state(path):
+        """(size, mtime in ns) of a file, or None if it is missing"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _atomic_write(self, path, write_fn):
+        """Write through a temporary file in the same directory, then rename into place"""
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            write_fn(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _write_csv(self, path, df, index):
+        # chunksize makes pandas format and flush the frame a slice at a time
+        df.to_csv(path, index=index, chunksize=self.chunk_rows)
+
+    def _write_text(self, path, text):
+        with open(path, 'w') as f:
+            f.write(text)
+
+    def _load_manifest(self):
+        try:
+            with open(self._manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest):
+        self._atomic_write(self._manifest_path,
+                           lambda path: self._write_text(path, json.dumps(manifest, indent=2, sort_keys=True)))
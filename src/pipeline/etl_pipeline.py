@@ -1,13 +1,8 @@
 import logging
 from datetime import datetime
-from extract.csv_extractor import extract_data
-from transform.data_cleaner import clean_data
-from transform.data_transformer import transform_data
-from transform.report_generator import create_summary_reports
-from load.csv_loader import save_outputs
-from utils.logger import setup_logging
+from utils.helpers import get_execution_backend
+from utils.metrics import get_metrics
 
-setup_logging()
 logger = logging.getLogger(__name__)
 
 def run_etl_pipeline():
@@ -15,37 +10,74 @@ def run_etl_pipeline():
     Main ETL pipeline orchestrator
     """
     try:
-        logger.info("Starting ETL pipeline execution")
+        # Stage modules pull in pandas, so import them here rather than at
+        # module level to keep importing the pipeline (CLI, DAG parsing) cheap
+        from transform.rollup_builder import build_rollups
+        from load.csv_loader import save_outputs
+
+        metrics = get_metrics()
+        backend = get_execution_backend()
+        logger.info("Starting ETL pipeline execution on the %s backend", backend)
         start_time = datetime.now()
         
-        # Extract phase
-        logger.info("Extracting data from CSV files")
-        raw_data = extract_data()
-        
-        if not raw_data:
-            logger.error("No data extracted. Check if CSV files exist in data/raw/")
-            return False
-        
-        # Transform phase - Clean and process data
-        logger.info("Cleaning extracted data")
-        cleaned_data = clean_data(raw_data)
-        
-        logger.info("Transforming data into business insights")
-        transformed_data = transform_data(cleaned_data)
+        if backend == 'duckdb':
+            from transform import duckdb_backend
+
+            # DuckDB reads data/raw itself, so extract and clean run inside
+            # its transform stage; the intermediate tables stay in DuckDB
+            with duckdb_backend.connect() as con:
+                logger.info("Extracting, cleaning and transforming data with DuckDB")
+                with metrics.timer('pipeline.stage', stage='transform'):
+                    transformed_data = duckdb_backend.transform_data(con)
+                
+                logger.info("Creating summary reports")
+                with metrics.timer('pipeline.stage', stage='reports'):
+                    reports = duckdb_backend.create_summary_reports(con)
+        else:
+            from extract.csv_extractor import extract_data
+            from transform.data_cleaner import clean_data
+            from transform.data_transformer import transform_data
+            from transform.report_generator import create_summary_reports
+
+            # Extract phase
+            logger.info("Extracting data from CSV files")
+            with metrics.timer('pipeline.stage', stage='extract'):
+                raw_data = extract_data()
+            
+            if not raw_data:
+                logger.error("No data extracted. Check if CSV files exist in data/raw/")
+                return False
+            
+            # Transform phase - Clean and process data
+            logger.info("Cleaning extracted data")
+            with metrics.timer('pipeline.stage', stage='clean'):
+                cleaned_data = clean_data(raw_data)
+            
+            logger.info("Transforming data into business insights")
+            with metrics.timer('pipeline.stage', stage='transform'):
+                transformed_data = transform_data(cleaned_data)
+            
+            logger.info("Creating summary reports")
+            with metrics.timer('pipeline.stage', stage='reports'):
+                reports = create_summary_reports(transformed_data)
         
-        logger.info("Creating summary reports")
-        reports = create_summary_reports(transformed_data)
+        logger.info("Building pre-aggregated rollup cubes")
+        with metrics.timer('pipeline.stage', stage='rollup'):
+            transformed_data.update(build_rollups(transformed_data))
         
         # Load phase - Save processed data
         logger.info("Saving output files")
-        save_outputs(transformed_data, reports)
+        with metrics.timer('pipeline.stage', stage='save'):
+            save_outputs(transformed_data, reports)
         
         # Calculate execution time
         execution_time = datetime.now() - start_time
-        logger.info(f"ETL pipeline completed successfully in {execution_time}")
+        logger.info("ETL pipeline completed successfully in %s", execution_time)
+        metrics.increment('pipeline.runs', status='success')
         
         return True
         
     except Exception as e:
-        logger.error(f"ETL pipeline failed: {str(e)}", exc_info=True)
+        logger.error("ETL pipeline failed: %s", e, exc_info=True)
+        get_metrics().increment('pipeline.runs', status='failed')
         return False
\ No newline at end of file
@@ -1,5 +1,6 @@
 from .data_cleaner import clean_data
 from .data_transformer import transform_data
 from .report_generator import create_summary_reports
+from .rollup_builder import build_rollups
 
-__all__ = ['clean_data', 'transform_data', 'create_summary_reports']
\ No newline at end of file
+__all__ = ['clean_data', 'transform_data', 'create_summary_reports', 'build_rollups']
\ No newline at end of file
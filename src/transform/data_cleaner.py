@@ -1,7 +1,7 @@
 import pandas as pd
 import logging
-import numpy as np
-from datetime import datetime
+from utils.metrics import get_metrics
+from transform.entity_resolution import resolve_candidates, remap_candidate_ids
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +47,7 @@ def clean_candidates_data(df):
             df.loc[missing_emails, 'Email'] = df.loc[missing_emails].apply(
                 lambda row: generate_email_from_names(row['FirstName'], row['LastName']), axis=1
             )
-            logger.info(f"Generated {missing_emails.sum()} emails for missing/invalid emails")
+            logger.info("Generated %s emails for missing/invalid emails", missing_emails.sum())
         
         # Also check for emails that don't follow the pattern and regenerate them
         invalid_email_pattern = ~df['Email'].str.contains(r'@capaciti\.org\.za$', na=False)
@@ -55,11 +55,11 @@ def clean_candidates_data(df):
             df.loc[invalid_email_pattern, 'Email'] = df.loc[invalid_email_pattern].apply(
                 lambda row: generate_email_from_names(row['FirstName'], row['LastName']), axis=1
             )
-            logger.info(f"Regenerated {invalid_email_pattern.sum()} emails with incorrect domain")
+            logger.info("Regenerated %s emails with incorrect domain", invalid_email_pattern.sum())
     else:
         # Create Email column if it doesn't exist
         df['Email'] = df.apply(lambda row: generate_email_from_names(row['FirstName'], row['LastName']), axis=1)
-        logger.info(f"Created Email column with generated emails from FirstName/LastName columns")
+        logger.info("Created Email column with generated emails from FirstName/LastName columns")
     
     # Convert date column
     if 'EnrollmentDate' in df.columns:
@@ -147,11 +147,35 @@ def clean_scrums_data(df):
 
     return df
 
-def clean_data(raw_data):
+def resolve_duplicate_candidates(raw_data):
+    """
+    Merge candidates re-registered under a new ID and point their placements
+    and coursera records at the surviving CandidateID.
+
+    Runs on the raw data so matching sees the original emails, before
+    clean_candidates_data regenerates them from names.
+    """
+    resolved_data = dict(raw_data)
+    resolved_data['candidates'], id_map = resolve_candidates(raw_data['candidates'])
+
+    for data_name in ['placements', 'coursera']:
+        if data_name in resolved_data:
+            resolved_data[data_name] = remap_candidate_ids(resolved_data[data_name], id_map)
+
+    get_metrics().increment('clean.candidates_merged', len(id_map))
+    return resolved_data
+
+def clean_data(raw_data, resolve_duplicates=True):
     """
     Clean all extracted data
     """
     cleaned_data = {}
+    metrics = get_metrics()
+    
+    if resolve_duplicates and 'candidates' in raw_data:
+        logger.info("Resolving duplicate candidate registrations...")
+        with metrics.timer('clean.entity_resolution'):
+            raw_data = resolve_duplicate_candidates(raw_data)
     
     cleaning_functions = {
         'candidates': clean_candidates_data,
@@ -166,13 +190,15 @@ def clean_data(raw_data):
     
     for data_name, df in raw_data.items():
         if data_name in cleaning_functions:
-            logger.info(f"Cleaning {data_name} data...")
-            cleaned_data[data_name] = cleaning_functions[data_name](df)
-            logger.info(f"Cleaned {len(cleaned_data[data_name])} rows in {data_name}")
+            logger.info("Cleaning %s data...", data_name)
+            with metrics.timer('clean.dataset', dataset=data_name):
+                cleaned_data[data_name] = cleaning_functions[data_name](df)
+            metrics.increment('clean.rows_dropped', len(df) - len(cleaned_data[data_name]), dataset=data_name)
+            logger.info("Cleaned %s rows in %s", len(cleaned_data[data_name]), data_name)
         else:
             # For any other data, just remove duplicates
             cleaned_data[data_name] = df.drop_duplicates()
-            logger.info(f"Basic cleaning done for {data_name}: {len(cleaned_data[data_name])} rows")
+            logger.info("Basic cleaning done for %s: %s rows", data_name, len(cleaned_data[data_name]))
     
     logger.info("Data cleaning completed")
     return cleaned_data
\ No newline at end of file
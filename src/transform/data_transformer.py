@@ -1,26 +1,34 @@
 import logging
 import pandas as pd
+from transform.key_encoder import encode_keys
 
 logger = logging.getLogger(__name__)
 
-def transform_data(cleaned_data):
+# pd.cut bins (right-closed) and labels for the AgeGroup column
+AGE_GROUP_BINS = [0, 25, 30, 35, 50]
+AGE_GROUP_LABELS = ['18-25', '26-30', '31-35', '36+']
+
+def transform_data(cleaned_data, key_dir=None):
     """
     Transform cleaned data into business insights
     """
     transformed_data = {}
     
+    # Joins and groupbys below use the integer surrogate keys
+    cleaned_data = encode_keys(cleaned_data, key_dir=key_dir)
+    
     # Enhanced candidate data with derived metrics
     if 'candidates' in cleaned_data and 'cohorts' in cleaned_data:
         candidates = cleaned_data['candidates'].copy()
         cohorts = cleaned_data['cohorts']
         
         # Merge with cohort information
-        candidates = candidates.merge(cohorts, on='CohortID', how='left')
+        candidates = candidates.merge(cohorts.drop(columns='CohortID'), on='CohortKey', how='left')
         
         # Calculate age groups
         candidates['AgeGroup'] = pd.cut(candidates['Age'], 
-                                      bins=[0, 25, 30, 35, 50], 
-                                      labels=['18-25', '26-30', '31-35', '36+'])
+                                      bins=AGE_GROUP_BINS, 
+                                      labels=AGE_GROUP_LABELS)
         
         # Calculate enrollment duration (if cohort has ended)
         if 'EndDate' in candidates.columns and 'EnrollmentDate' in candidates.columns:
@@ -35,8 +43,8 @@ def transform_data(cleaned_data):
         candidates = cleaned_data['candidates']
         
         # Merge placement data with candidate info
-        placement_analysis = placements.merge(candidates[['CandidateID', 'Age', 'Gender', 'CohortID', 'ProvinceID']], 
-                                            on='CandidateID', how='left')
+        placement_analysis = placements.merge(candidates[['CandidateKey', 'Age', 'Gender', 'CohortID', 'CohortKey', 'ProvinceID', 'ProvinceKey']], 
+                                            on='CandidateKey', how='left')
         
         transformed_data['placement_analysis'] = placement_analysis
         logger.info("Placement analysis data created")
@@ -47,8 +55,8 @@ def transform_data(cleaned_data):
         candidates = cleaned_data['candidates']
         
         # Calculate completion rates by candidate demographics
-        coursera_analysis = coursera.merge(candidates[['CandidateID', 'Gender', 'Age', 'CohortID']], 
-                                         on='CandidateID', how='left')
+        coursera_analysis = coursera.merge(candidates[['CandidateKey', 'Gender', 'Age', 'CohortID', 'CohortKey']], 
+                                         on='CandidateKey', how='left')
         
         transformed_data['coursera_analysis'] = coursera_analysis
         logger.info("Coursera analysis data created")
@@ -60,23 +68,23 @@ def transform_data(cleaned_data):
         projects = cleaned_data['projects']
         
         # Team activity analysis - handle missing columns gracefully
-        scrum_metrics = scrums.groupby('TeamID').agg({
+        scrum_metrics = scrums.groupby('TeamKey').agg({
             'ScrumID': 'count'
         }).rename(columns={'ScrumID': 'TotalScrums'})
         
         # Add attendance metrics if the column exists
         if 'AttendanceCount' in scrums.columns:
-            attendance_metrics = scrums.groupby('TeamID')['AttendanceCount'].mean()
+            attendance_metrics = scrums.groupby('TeamKey')['AttendanceCount'].mean()
             scrum_metrics['AvgAttendance'] = attendance_metrics
         
-        team_performance = teams.merge(scrum_metrics, on='TeamID', how='left')
+        team_performance = teams.merge(scrum_metrics, on='TeamKey', how='left')
         
         # Add project count per team
-        project_count = projects.groupby('TeamID').size().reset_index(name='ProjectCount')
-        team_performance = team_performance.merge(project_count, on='TeamID', how='left')
+        project_count = projects.groupby('TeamKey').size().reset_index(name='ProjectCount')
+        team_performance = team_performance.merge(project_count, on='TeamKey', how='left')
         
         transformed_data['team_performance'] = team_performance
         logger.info("Team performance data created")
     
-    logger.info(f"Data transformation completed. Created {len(transformed_data)} transformed datasets")
+    logger.info("Data transformation completed. Created %s transformed datasets", len(transformed_data))
     return transformed_data
\ No newline at end of file
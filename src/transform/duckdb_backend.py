@@ -0,0 +1,440 @@
+import logging
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from extract.csv_extractor import DATA_FILES
+from transform.data_cleaner import clean_candidates_data, clean_cohorts_data, clean_provinces_data, clean_teams_data
+from transform.data_transformer import AGE_GROUP_BINS, AGE_GROUP_LABELS
+from transform.entity_resolution import resolve_candidates
+from transform.key_encoder import KEY_COLUMNS, KEY_DTYPE, load_registries, save_registries, surrogate_column
+from transform.report_generator import SUCCESSFUL_PLACEMENT_PATTERN
+from utils.helpers import ensure_directory_exists, get_data_path
+from utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# Strings pandas.read_csv reads as missing values by default
+PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+# Values pandas.read_csv parses as int64 / float64 rather than keeping the column as strings
+INTEGER_PATTERN = r'\s*[+-]?[0-9]+\s*'
+FLOAT_PATTERN = r'\s*[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?\s*'
+
+# The dimensions are small enough to reuse the pandas cleaners; candidates
+# also go through entity resolution in pandas (see _clean_candidates)
+DIMENSION_CLEANERS = {
+    'cohorts': clean_cohorts_data,
+    'teams': clean_teams_data,
+    'provinces': clean_provinces_data,
+}
+
+# Fact tables are cleaned in SQL, following the cleaners in transform/data_cleaner.py:
+# dataset -> (ID column duplicates are dropped on, date columns, columns a row needs)
+FACT_CLEANING = {
+    'coursera': ('ProgressID', ['DateCompleted'], []),
+    'placements': ('PlacementID', ['StartDate', 'EndDate'],
+                   ['PlacementID', 'CandidateID', 'PlacementStatus', 'CompanyName', 'StartDate']),
+    'projects': ('ProjectID', [], []),
+    'scrums': ('ScrumID', ['SessionDate'], []),
+}
+
+# Row position in the source file or frame, used to keep pandas row order.
+# Joins and deduplication avoid window functions over it: DuckDB sorts those
+# in memory, while its aggregates and hash joins spill to disk.
+ROW_COLUMN = '_row'
+
+@contextmanager
+def connect():
+    """
+    DuckDB connection on a scratch database file, so tables larger than
+    memory are paged out instead of held in RAM. Configured from
+    DUCKDB_TEMP_DIR (where the file and spilled join/aggregation state go,
+    default the system temp directory), DUCKDB_MEMORY_LIMIT (e.g. "4GB")
+    and DUCKDB_THREADS.
+    """
+    try:
+        import duckdb
+    except ImportError as e:
+        raise ImportError("ETL_BACKEND=duckdb requires the duckdb package (pip install duckdb)") from e
+
+    temp_dir = os.getenv("DUCKDB_TEMP_DIR")
+    work_dir = tempfile.mkdtemp(prefix="youth_tracker_duckdb_", dir=temp_dir and ensure_directory_exists(Path(temp_dir)))
+    config = {'temp_directory': work_dir}
+    if os.getenv("DUCKDB_MEMORY_LIMIT"):
+        config['memory_limit'] = os.getenv("DUCKDB_MEMORY_LIMIT")
+    if os.getenv("DUCKDB_THREADS"):
+        config['threads'] = int(os.getenv("DUCKDB_THREADS"))
+
+    con = duckdb.connect(os.path.join(work_dir, "etl.duckdb"), config=config)
+    try:
+        yield con
+    finally:
+        con.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+def _literal(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+def _columns(con, table):
+    return [column for column in con.table(table).columns if column != ROW_COLUMN]
+
+def _fetch(con, query):
+    """
+    Run a query into a DataFrame. BIGINT columns come back as int64, or as
+    float64 when they have gaps, as pandas reads and merges them; surrogate
+    keys stay KEY_DTYPE.
+    """
+    df = con.sql(query).df()
+    for column in df.columns:
+        if column in KEY_COLUMNS:
+            df[column] = df[column].astype(KEY_DTYPE)
+        elif df[column].dtype == 'Int64':
+            df[column] = df[column].astype('float64' if df[column].hasnans else 'int64')
+    return df
+
+def _fetch_table(con, table):
+    return _fetch(con, f"SELECT * EXCLUDE ({ROW_COLUMN}) FROM {table} ORDER BY {ROW_COLUMN}")
+
+def _store(con, table, df):
+    """Copy a DataFrame into `table`, numbering its rows"""
+    con.register('_frame', df.assign(**{ROW_COLUMN: np.arange(len(df))}))
+    con.execute(f"CREATE TABLE {table} AS SELECT * FROM _frame")
+    con.unregister('_frame')
+
+def _read_raw(con, name, path):
+    """
+    Load a raw CSV into raw_<name>. Columns get the types pandas.read_csv
+    would infer: BIGINT if every value is an integer, DOUBLE if every value
+    is a number, VARCHAR otherwise.
+
+    The dialect is fixed to pandas' defaults rather than sniffed: unquoted
+    commas in free-text columns make the sniffer guess another delimiter.
+    Rows with the wrong number of fields are skipped, like on_bad_lines='skip'
+    (pandas pads short rows instead).
+    """
+    source = (
+        f"read_csv({_literal(path)}, header = true, delim = ',', quote = '\"', escape = '\"', "
+        f"all_varchar = true, ignore_errors = true, nullstr = [{', '.join(map(_literal, PANDAS_NA_VALUES))}])"
+    )
+    columns = con.sql(f"SELECT * FROM {source} LIMIT 0").columns
+    checks = [
+        f"bool_and({_quote(column)} IS NULL OR regexp_full_match({_quote(column)}, {_literal(pattern)}))"
+        for column in columns for pattern in (INTEGER_PATTERN, FLOAT_PATTERN)
+    ]
+    flags = con.execute(f"SELECT {', '.join(checks)} FROM {source}").fetchone()
+
+    select = []
+    for i, column in enumerate(columns):
+        is_integer, is_float = flags[2 * i], flags[2 * i + 1]
+        column_type = 'BIGINT' if is_integer else 'DOUBLE' if is_float else None
+        select.append(f"CAST(trim({_quote(column)}) AS {column_type}) AS {_quote(column)}" if column_type else _quote(column))
+
+    # Insertion order is preserved, so rowid is the position in the file
+    con.execute(f"CREATE TABLE raw_{name} AS SELECT {', '.join(select)} FROM {source}")
+    rows = con.execute(f"SELECT COUNT(*) FROM raw_{name}").fetchone()[0]
+    get_metrics().increment('extract.rows', rows, dataset=name)
+    logger.info("Read %s with %s rows", path, rows)
+
+def _clean_candidates(con):
+    """
+    Merge re-registered candidates and clean them in pandas, as clean_data
+    does; the facts are pointed at the surviving IDs through the id_map table
+    """
+    candidates, id_map = resolve_candidates(_fetch(con, "SELECT * FROM raw_candidates ORDER BY rowid"))
+    get_metrics().increment('clean.candidates_merged', len(id_map))
+    _store(con, 'clean_candidates', clean_candidates_data(candidates))
+
+    con.register('_id_map', pd.DataFrame({
+        'CandidateID': pd.Series(list(id_map.keys()), dtype=str),
+        'SurvivorID': pd.Series(list(id_map.values()), dtype=str),
+    }))
+    con.execute("CREATE TABLE id_map AS SELECT * FROM _id_map")
+    con.unregister('_id_map')
+
+def _clean_fact(con, name, id_column, date_columns, required_columns):
+    """Drop duplicate IDs (keeping the first), coerce dates and drop rows missing required values"""
+    columns = _columns(con, f"raw_{name}")
+    select = []
+    for column in columns:
+        value = f"r.{_quote(column)}"
+        if column == 'CandidateID':
+            value = f'coalesce(m."SurvivorID", {value})'
+        if column in date_columns:
+            value = f"TRY_CAST({value} AS TIMESTAMP)"
+        select.append(f"{value} AS {_quote(column)}")
+
+    remap = 'LEFT JOIN id_map m ON r."CandidateID" = m."CandidateID"' if 'CandidateID' in columns else ''
+    required = [c for c in required_columns if c in columns]
+    where = f"WHERE {' AND '.join(f'{_quote(c)} IS NOT NULL' for c in required)}" if required else ''
+    con.execute(f"""
+        CREATE TABLE clean_{name} AS
+        SELECT * FROM (
+            SELECT r.{ROW_COLUMN}, {', '.join(select)}
+            FROM (SELECT rowid AS {ROW_COLUMN}, * FROM raw_{name}) r {remap}
+            WHERE r.{ROW_COLUMN} IN (SELECT MIN(rowid) FROM raw_{name} GROUP BY {_quote(id_column)})
+        ) {where}
+    """)
+
+def _encode_keys(con, datasets, key_dir):
+    """
+    Add the surrogate key columns to every cleaned table, registering natural
+    keys in the order encode_keys would see them so both backends assign the
+    same keys
+    """
+    registries = load_registries(key_dir)
+    registered_before = {column: len(registry) for column, registry in registries.items()}
+    columns = {name: _columns(con, f"clean_{name}") for name in datasets}
+
+    for natural_column, registry in registries.items():
+        natural_key = f"trim(CAST({_quote(natural_column)} AS VARCHAR))"
+        sources = [
+            f"SELECT {i} AS dataset, {ROW_COLUMN}, {natural_key} AS natural_key FROM clean_{name}"
+            for i, name in enumerate(datasets) if natural_column in columns[name]
+        ]
+        if not sources:
+            continue
+        naturals = con.sql(f"""
+            SELECT natural_key FROM ({' UNION ALL '.join(sources)})
+            WHERE natural_key <> ''
+            GROUP BY natural_key ORDER BY MIN({{'dataset': dataset, 'row': {ROW_COLUMN}}})
+        """).df()['natural_key']
+        con.register('_keys', pd.DataFrame({'natural_key': naturals, 'surrogate_key': registry.encode(naturals)}))
+        con.execute(f"CREATE TABLE keys_{registry.entity} AS SELECT * FROM _keys")
+        con.unregister('_keys')
+    save_registries(registries, registered_before)
+
+    for name in datasets:
+        select, joins = ['d.*'], []
+        for natural_column, registry in registries.items():
+            if natural_column in columns[name]:
+                alias = f"k_{registry.entity}"
+                select.append(f"{alias}.surrogate_key AS {_quote(surrogate_column(natural_column))}")
+                joins.append(
+                    f"LEFT JOIN keys_{registry.entity} {alias} "
+                    f"ON trim(CAST(d.{_quote(natural_column)} AS VARCHAR)) = {alias}.natural_key"
+                )
+        con.execute(f"CREATE TABLE {name} AS SELECT {', '.join(select)} FROM clean_{name} d {' '.join(joins)}")
+
+def _left_join(con, left, right, on, right_columns=None):
+    """
+    SELECT for a pandas-style left merge: left row order (then right row
+    order for repeated matches), _x/_y suffixes on shared columns and missing
+    keys matching missing keys
+    """
+    left_columns = _columns(con, left)
+    right_columns = right_columns or _columns(con, right)
+    shared = (set(left_columns) & set(right_columns)) - {on}
+    select = [f"l.{_quote(c)} AS {_quote(c + '_x' if c in shared else c)}" for c in left_columns]
+    select += [f"r.{_quote(c)} AS {_quote(c + '_y' if c in shared else c)}" for c in right_columns if c != on]
+    return f"""
+        SELECT {{'left': l.{ROW_COLUMN}, 'right': r.{ROW_COLUMN}}} AS {ROW_COLUMN}, {', '.join(select)}
+        FROM {left} l LEFT JOIN {right} r ON l.{_quote(on)} IS NOT DISTINCT FROM r.{_quote(on)}
+    """
+
+def _age_group(column):
+    """CASE equivalent of pd.cut(column, bins=AGE_GROUP_BINS, labels=AGE_GROUP_LABELS)"""
+    cases = ' '.join(
+        f"WHEN {column} > {low} AND {column} <= {high} THEN {_literal(label)}"
+        for low, high, label in zip(AGE_GROUP_BINS[:-1], AGE_GROUP_BINS[1:], AGE_GROUP_LABELS)
+    )
+    return f"CASE {cases} END"
+
+def _transform(con, datasets):
+    """The joins and aggregations of transform_data, as tables in the connection"""
+    transformed = []
+
+    # Enhanced candidate data with derived metrics
+    if 'candidates' in datasets and 'cohorts' in datasets:
+        joined = _left_join(con, 'candidates', 'cohorts', 'CohortKey',
+                            [c for c in _columns(con, 'cohorts') if c != 'CohortID'])
+        derived = [f'{_age_group(_quote("Age"))} AS "AgeGroup"']
+        if {'EndDate', 'EnrollmentDate'} <= set(con.sql(joined).columns):
+            # Whole days, floored like Timedelta.days
+            derived.append('CAST(floor((epoch_us("EndDate") - epoch_us("EnrollmentDate")) / 86400000000) AS BIGINT) '
+                           'AS "EnrollmentDuration"')
+        con.execute(f"CREATE TABLE enhanced_candidates AS SELECT *, {', '.join(derived)} FROM ({joined})")
+        transformed.append('enhanced_candidates')
+        logger.info("Enhanced candidates data created")
+
+    # Placement success metrics
+    if 'placements' in datasets and 'candidates' in datasets:
+        con.execute("CREATE TABLE placement_analysis AS " + _left_join(
+            con, 'placements', 'candidates', 'CandidateKey',
+            ['CandidateKey', 'Age', 'Gender', 'CohortID', 'CohortKey', 'ProvinceID', 'ProvinceKey']))
+        transformed.append('placement_analysis')
+        logger.info("Placement analysis data created")
+
+    # Coursera completion analysis
+    if 'coursera' in datasets and 'candidates' in datasets:
+        con.execute("CREATE TABLE coursera_analysis AS " + _left_join(
+            con, 'coursera', 'candidates', 'CandidateKey', ['CandidateKey', 'Gender', 'Age', 'CohortID', 'CohortKey']))
+        transformed.append('coursera_analysis')
+        logger.info("Coursera analysis data created")
+
+    # Team performance metrics
+    if 'teams' in datasets and 'scrums' in datasets and 'projects' in datasets:
+        scrum_metrics = {'TotalScrums': 'COUNT("ScrumID")'}
+        if 'AttendanceCount' in _columns(con, 'scrums'):
+            scrum_metrics['AvgAttendance'] = 'AVG("AttendanceCount")'
+        aggregates = ', '.join(f"{sql} AS {_quote(name)}" for name, sql in scrum_metrics.items())
+        con.execute(f"""
+            CREATE TABLE team_performance AS
+            WITH scrum_metrics AS (
+                SELECT "TeamKey", {aggregates} FROM scrums WHERE "TeamKey" IS NOT NULL GROUP BY "TeamKey"
+            ), project_count AS (
+                SELECT "TeamKey", COUNT(*) AS "ProjectCount" FROM projects WHERE "TeamKey" IS NOT NULL GROUP BY "TeamKey"
+            )
+            SELECT t.*, {', '.join(f's.{_quote(name)}' for name in scrum_metrics)}, p."ProjectCount"
+            FROM teams t
+            LEFT JOIN scrum_metrics s ON t."TeamKey" = s."TeamKey"
+            LEFT JOIN project_count p ON t."TeamKey" = p."TeamKey"
+        """)
+        transformed.append('team_performance')
+        logger.info("Team performance data created")
+
+    return transformed
+
+def transform_data(con, raw_dir=None, key_dir=None):
+    """
+    Extract, clean and transform the raw CSVs in DuckDB, producing the same
+    datasets as extract_data -> clean_data -> transform_data. The cleaned and
+    transformed tables stay in the connection for create_summary_reports;
+    only the transformed datasets are returned as DataFrames.
+    """
+    data_path = Path(raw_dir or get_data_path("raw"))
+    metrics = get_metrics()
+
+    datasets = []
+    for name, filename in DATA_FILES.items():
+        file_path = data_path / filename
+        if file_path.exists():
+            _read_raw(con, name, file_path)
+            datasets.append(name)
+        else:
+            logger.warning("File not found: %s", file_path)
+
+    if 'candidates' in datasets:
+        logger.info("Resolving duplicate candidate registrations...")
+        with metrics.timer('clean.entity_resolution'):
+            _clean_candidates(con)
+    else:
+        con.execute('CREATE TABLE id_map ("CandidateID" VARCHAR, "SurvivorID" VARCHAR)')
+
+    for name in datasets:
+        with metrics.timer('clean.dataset', dataset=name):
+            if name in FACT_CLEANING:
+                _clean_fact(con, name, *FACT_CLEANING[name])
+            elif name in DIMENSION_CLEANERS:
+                _store(con, f"clean_{name}", DIMENSION_CLEANERS[name](_fetch(con, f"SELECT * FROM raw_{name} ORDER BY rowid")))
+        raw_rows, clean_rows = con.execute(
+            f"SELECT (SELECT COUNT(*) FROM raw_{name}), (SELECT COUNT(*) FROM clean_{name})"
+        ).fetchone()
+        metrics.increment('clean.rows_dropped', raw_rows - clean_rows, dataset=name)
+        logger.info("Cleaned %s rows in %s", clean_rows, name)
+
+    _encode_keys(con, datasets, key_dir)
+
+    transformed_data = {name: _fetch_table(con, name) for name in _transform(con, datasets)}
+    if 'enhanced_candidates' in transformed_data:
+        candidates = transformed_data['enhanced_candidates']
+        candidates['AgeGroup'] = pd.Categorical(candidates['AgeGroup'], categories=AGE_GROUP_LABELS, ordered=True)
+
+    logger.info("Data transformation completed with DuckDB. Created %s transformed datasets", len(transformed_data))
+    return transformed_data
+
+def _has_table(con, name):
+    return con.execute("SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ?", [name]).fetchone()[0] > 0
+
+def _value_counts(con, table, column):
+    """Counts of each value in first-appearance order, as value_counts builds them before sorting"""
+    counts = _fetch(con, f"""
+        SELECT {_quote(column)} AS value, COUNT(*) AS n FROM {table}
+        WHERE {_quote(column)} IS NOT NULL GROUP BY ALL ORDER BY MIN({ROW_COLUMN})
+    """)
+    return pd.Series(counts['n'].to_numpy(), index=counts['value'].tolist())
+
+def _status_counts(con, row_expression, row_name):
+    """groupby(row)['PlacementStatus'].value_counts().unstack(fill_value=0), counted in DuckDB"""
+    counts = _fetch(con, f"""
+        SELECT {row_expression} AS {_quote(row_name)}, "PlacementStatus", COUNT(*) AS n FROM placement_analysis
+        WHERE {row_expression} IS NOT NULL AND "PlacementStatus" IS NOT NULL GROUP BY ALL
+    """)
+    if row_name == 'Age':
+        counts['Age'] = pd.Categorical(counts['Age'], categories=AGE_GROUP_LABELS, ordered=True)
+    # DuckDB returns groups in any order; groupby sorts them as the pandas path does
+    return counts.groupby([row_name, 'PlacementStatus'], observed=True)['n'].sum().unstack(fill_value=0)
+
+def create_summary_reports(con):
+    """
+    create_summary_reports over the tables transform_data left in the
+    connection; only the aggregated results are fetched
+    """
+    reports = {}
+
+    # Overall program summary
+    program_summary = {}
+
+    if _has_table(con, 'enhanced_candidates'):
+        total, age_sum, age_count = con.execute(
+            'SELECT COUNT(*), SUM("Age"), COUNT("Age") FROM enhanced_candidates'
+        ).fetchone()
+        program_summary['total_candidates'] = total
+        program_summary['gender_distribution'] = _value_counts(
+            con, 'enhanced_candidates', 'Gender').sort_values(ascending=False).to_dict()
+        program_summary['age_distribution'] = _value_counts(
+            con, 'enhanced_candidates', 'AgeGroup').reindex(AGE_GROUP_LABELS, fill_value=0).sort_values(ascending=False).to_dict()
+        program_summary['avg_age'] = np.float64(age_sum) / age_count if age_count else np.nan
+
+    if _has_table(con, 'placement_analysis'):
+        total_placements, successful_placements = con.execute(
+            'SELECT COUNT(*), COUNT(*) FILTER (WHERE regexp_matches("PlacementStatus", ?, \'i\')) FROM placement_analysis',
+            [SUCCESSFUL_PLACEMENT_PATTERN],
+        ).fetchone()
+        program_summary['placement_rate'] = (successful_placements / total_placements * 100) if total_placements > 0 else 0
+        program_summary['total_placements'] = total_placements
+        program_summary['successful_placements'] = successful_placements
+
+    if _has_table(con, 'coursera_analysis'):
+        total_courses, unique_courses = con.execute(
+            'SELECT COUNT(*), COUNT(DISTINCT "CourseName") FROM coursera_analysis'
+        ).fetchone()
+        program_summary['total_course_completions'] = total_courses
+        program_summary['unique_courses'] = unique_courses
+
+    reports['program_summary'] = program_summary
+
+    # Detailed analytics
+    if _has_table(con, 'placement_analysis'):
+        placement_analytics = {}
+        placement_analytics['by_gender'] = _status_counts(con, '"Gender"', 'Gender')
+        placement_analytics['by_age_group'] = _status_counts(con, _age_group('"Age"'), 'Age')
+        if 'ProvinceID' in _columns(con, 'placement_analysis'):
+            placement_analytics['by_province'] = _status_counts(con, '"ProvinceID"', 'ProvinceID')
+        reports['placement_analytics'] = placement_analytics
+
+    if _has_table(con, 'coursera_analysis'):
+        course_analytics = {}
+        by_gender = _fetch(con, 'SELECT "Gender", COUNT(*) AS n FROM coursera_analysis WHERE "Gender" IS NOT NULL GROUP BY ALL')
+        course_analytics['completion_by_gender'] = by_gender.set_index('Gender')['n'].rename(None).sort_index()
+        by_course = _fetch(con, '''
+            SELECT "CourseName", COUNT("CandidateID") AS "CandidateID" FROM coursera_analysis
+            WHERE "CourseName" IS NOT NULL GROUP BY ALL
+        ''')
+        course_analytics['completion_by_course'] = by_course.set_index('CourseName').sort_index().round(2)
+        reports['course_analytics'] = course_analytics
+
+    if _has_table(con, 'team_performance'):
+        reports['team_analytics'] = _fetch_table(con, 'team_performance')
+
+    logger.info("Created %s summary reports with DuckDB", len(reports))
+    return reports
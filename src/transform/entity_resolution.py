@@ -0,0 +1,272 @@
+import logging
+import zlib
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Blocks larger than this are placeholder values ("0", shared office numbers)
+# and would reintroduce quadratic comparisons, so they are skipped
+MAX_BLOCK_SIZE = 50
+# Records compared on each side in the sorted-neighbourhood passes
+NEIGHBOURHOOD_WINDOW = 5
+
+NGRAM_DIMS = 128
+PHONE_DIGITS = 9
+
+# No single signal reaches the threshold on its own: an identical name needs
+# a (near-)identical phone or email as well, and a near-identical phone and
+# email together still need a similar name
+NAME_WEIGHT = 0.4
+PHONE_WEIGHT = 0.35
+EMAIL_WEIGHT = 0.35
+MATCH_THRESHOLD = 0.75
+# Phone and email only count when they are this close (one mistyped digit, or a
+# typo-level difference in the email local part); unrelated contacts, and
+# numbers handed out in sequence, add nothing
+PHONE_MIN_SIMILARITY = 8 / 9
+EMAIL_MIN_SIMILARITY = 0.8
+MAX_AGE_DIFFERENCE = 2
+
+# Pairs scored per batch, bounding the gathered (pairs x NGRAM_DIMS) vectors
+SCORE_BATCH_PAIRS = 250_000
+
+def _normalize_text(values):
+    """Lowercase, strip accents and keep only letters and spaces"""
+    text = values.astype(object).where(values.notna(), '').astype(str)
+    text = text.str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii')
+    return text.str.lower().str.replace(r'[^a-z ]', '', regex=True).str.strip()
+
+def _normalize_phone(values):
+    """Last nine digits, which drops the 0 / +27 prefix and Excel's lost leading zero"""
+    digits = values.astype(str).str.replace(r'\D', '', regex=True)
+    return digits.str[-PHONE_DIGITS:].where(digits.str.len() >= PHONE_DIGITS, '')
+
+def _normalize_email(values):
+    """Lowercased address with any +tag removed from the local part"""
+    emails = values.astype(str).str.strip().str.lower()
+    emails = emails.str.replace(r'\+[^@]*@', '@', regex=True)
+    return emails.where(emails.str.contains('@', regex=False) & values.notna(), '')
+
+def _bigram_vectors(texts):
+    """Unit-length hashed character-bigram count vectors, one row per text (zero for empty text)"""
+    vectors = np.zeros((len(texts), NGRAM_DIMS), dtype=np.float32)
+    buckets = {}
+    for row, text in enumerate(texts):
+        if not text.strip():
+            continue
+        padded = f" {text} "
+        for i in range(len(padded) - 1):
+            bigram = padded[i:i + 2]
+            if bigram not in buckets:
+                buckets[bigram] = zlib.crc32(bigram.encode()) % NGRAM_DIMS
+            vectors[row, buckets[bigram]] += 1
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+def _block_pairs(keys):
+    """Index pairs (i < j) of records that share a non-empty blocking key"""
+    frame = pd.DataFrame({'key': keys.values, 'idx': np.arange(len(keys))})
+    frame = frame[frame['key'] != '']
+    sizes = frame.groupby('key')['idx'].transform('size')
+    frame = frame[(sizes > 1) & (sizes <= MAX_BLOCK_SIZE)]
+
+    pairs = frame.merge(frame, on='key', suffixes=('_l', '_r'))
+    pairs = pairs[pairs['idx_l'] < pairs['idx_r']]
+    return pairs['idx_l'].to_numpy(), pairs['idx_r'].to_numpy()
+
+def _neighbourhood_pairs(sort_keys):
+    """Index pairs of records within NEIGHBOURHOOD_WINDOW of each other once sorted"""
+    order = np.argsort(sort_keys.to_numpy(), kind='stable')
+    left, right = [], []
+    for offset in range(1, NEIGHBOURHOOD_WINDOW):
+        left.append(order[:-offset])
+        right.append(order[offset:])
+    if not left:
+        return np.array([], dtype=int), np.array([], dtype=int)
+
+    left, right = np.concatenate(left), np.concatenate(right)
+    return np.minimum(left, right), np.maximum(left, right)
+
+def _digit_matrix(phones):
+    """Normalized phones as an (n, PHONE_DIGITS) array of digit bytes; empty phones become 'x's"""
+    padded = phones.str.pad(PHONE_DIGITS, fillchar='x')
+    return np.frombuffer(''.join(padded).encode('ascii'), dtype=np.uint8).reshape(-1, PHONE_DIGITS)
+
+def candidate_pairs(features):
+    """
+    Candidate record pairs from the blocking index: exact phone, exact email
+    local part, and sorted neighbourhoods over last+first and first+last name
+    and over phone and email read forwards and backwards, so a typo near
+    either end still leaves the two records next to each other
+    """
+    phone, email = features['phone'], features['email']
+    blocks = [
+        _block_pairs(phone),
+        _block_pairs(email.str.split('@').str[0].str.replace('.', '', regex=False)),
+        _neighbourhood_pairs(features['last_name'] + ' ' + features['first_name']),
+        _neighbourhood_pairs(features['first_name'] + ' ' + features['last_name']),
+    ]
+    for keys in [phone, email]:
+        present = keys[keys != '']
+        if len(present) > 1:
+            positions = present.index.to_numpy()
+            for sort_keys in [present, present.str[::-1]]:
+                left, right = _neighbourhood_pairs(sort_keys)
+                blocks.append((positions[left], positions[right]))
+    left = np.concatenate([b[0] for b in blocks])
+    right = np.concatenate([b[1] for b in blocks])
+
+    # Deduplicate pairs found by several blocks via a single int64 code per pair
+    n = len(features)
+    codes = np.minimum(left, right).astype(np.int64) * n + np.maximum(left, right)
+    codes.sort()
+    codes = codes[np.concatenate([[True], codes[1:] != codes[:-1]])] if len(codes) else codes
+    return codes // n, codes % n
+
+def score_pairs(features, vectors, left, right):
+    """
+    Vectorized match score in [0, 1] for each pair; vetoed pairs score 0.
+    vectors holds the 'name' and 'email' bigram vectors from _bigram_vectors.
+    """
+    digits = _digit_matrix(features['phone'])
+    has_phone = (features['phone'] != '').to_numpy()
+    gender = features['gender'].to_numpy()
+    age = features['age'].to_numpy(dtype=float)
+
+    scores = np.empty(len(left))
+    for start in range(0, len(left), SCORE_BATCH_PAIRS):
+        l = left[start:start + SCORE_BATCH_PAIRS]
+        r = right[start:start + SCORE_BATCH_PAIRS]
+
+        name_similarity = np.einsum('ij,ij->i', vectors['name'][l], vectors['name'][r])
+
+        # Share of the nine phone digits that agree position by position
+        phone_similarity = (digits[l] == digits[r]).mean(axis=1) * (has_phone[l] & has_phone[r])
+        phone_similarity = np.where(phone_similarity >= PHONE_MIN_SIMILARITY, phone_similarity, 0.0)
+
+        email_similarity = np.einsum('ij,ij->i', vectors['email'][l], vectors['email'][r])
+        email_similarity = np.where(email_similarity >= EMAIL_MIN_SIMILARITY, email_similarity, 0.0)
+
+        score = NAME_WEIGHT * name_similarity + PHONE_WEIGHT * phone_similarity + EMAIL_WEIGHT * email_similarity
+        # float32 cosines of identical names land just under 1; don't let that decide a match at the threshold
+        score = np.round(score, 6)
+
+        # Hard vetoes: different known genders, or ages too far apart
+        gender_conflict = (gender[l] != gender[r]) & (gender[l] != '') & (gender[r] != '')
+        age_conflict = np.abs(age[l] - age[r]) > MAX_AGE_DIFFERENCE
+
+        scores[start:start + SCORE_BATCH_PAIRS] = np.where(gender_conflict | age_conflict, 0.0, np.minimum(score, 1.0))
+    return scores
+
+def _connected_components(features, left, right, scores):
+    """
+    Cluster label per record from matched pairs (union-find). Pairs are merged
+    best match first, and a merge is skipped when the combined cluster would
+    hold two different known genders or ages more than MAX_AGE_DIFFERENCE
+    apart, so the vetoes also hold between records linked through a third.
+    """
+    n = len(features)
+    parent = np.arange(n)
+    # Per cluster root: its known gender ('' if none yet) and age range
+    gender = features['gender'].to_numpy(dtype=object).copy()
+    age_min = features['age'].to_numpy(dtype=float).copy()
+    age_max = age_min.copy()
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    order = np.argsort(-scores, kind='stable')
+    for a, b in zip(left[order], right[order]):
+        root_a, root_b = find(a), find(b)
+        if root_a == root_b:
+            continue
+        if gender[root_a] and gender[root_b] and gender[root_a] != gender[root_b]:
+            continue
+        low, high = np.fmin(age_min[root_a], age_min[root_b]), np.fmax(age_max[root_a], age_max[root_b])
+        if high - low > MAX_AGE_DIFFERENCE:
+            continue
+
+        root, child = min(root_a, root_b), max(root_a, root_b)
+        parent[child] = root
+        gender[root] = gender[root_a] or gender[root_b]
+        age_min[root], age_max[root] = low, high
+
+    # Only records that took part in a match can have moved away from themselves
+    labels = np.arange(n)
+    for i in np.unique(np.concatenate([left, right])):
+        labels[i] = find(i)
+    return labels
+
+def resolve_candidates(candidates):
+    """
+    Find candidates registered more than once under different IDs.
+
+    Returns (candidates with one merged row per person, mapping of retired
+    CandidateID -> surviving CandidateID). The surviving record is the
+    earliest enrolment; gaps in it are filled from the retired records.
+    """
+    if candidates.empty or 'CandidateID' not in candidates.columns:
+        return candidates, {}
+
+    records = candidates.drop_duplicates(subset=['CandidateID']).reset_index(drop=True)
+
+    def column(name):
+        return records[name] if name in records.columns else pd.Series('', index=records.index)
+
+    features = pd.DataFrame({
+        'first_name': _normalize_text(column('FirstName')),
+        'last_name': _normalize_text(column('LastName')),
+        'phone': _normalize_phone(column('PhoneNumber')),
+        'email': _normalize_email(column('Email')),
+        'gender': _normalize_text(column('Gender')).replace('unknown', ''),
+        'age': pd.to_numeric(column('Age'), errors='coerce'),
+    })
+    vectors = {
+        'name': _bigram_vectors((features['first_name'] + ' ' + features['last_name']).tolist()),
+        # Local part only; shared domains say nothing about identity
+        'email': _bigram_vectors(features['email'].str.split('@').str[0].tolist()),
+    }
+
+    left, right = candidate_pairs(features)
+    scores = score_pairs(features, vectors, left, right)
+    matched = scores >= MATCH_THRESHOLD
+    logger.info("Entity resolution compared %s candidate pairs for %s records, %s matched",
+                len(left), len(records), int(matched.sum()))
+
+    if not matched.any():
+        return candidates, {}
+
+    records['_cluster'] = _connected_components(features, left[matched], right[matched], scores[matched])
+
+    # Survivor first within each cluster so groupby().first() keeps its values
+    enrolled = pd.to_datetime(column('EnrollmentDate'), errors='coerce')
+    records = records.assign(_enrolled=enrolled).sort_values(['_cluster', '_enrolled', 'CandidateID'])
+    survivors = records.groupby('_cluster')['CandidateID'].transform('first')
+    id_map = dict(zip(records['CandidateID'][records['CandidateID'] != survivors],
+                      survivors[records['CandidateID'] != survivors]))
+
+    merged = records.groupby('_cluster', sort=False).first()
+    merged = merged.drop(columns='_enrolled').reset_index(drop=True)
+    # Back to the input row order, minus the retired registrations
+    merged = merged.set_index('CandidateID').reindex(
+        candidates['CandidateID'][~candidates['CandidateID'].isin(id_map)].drop_duplicates()
+    ).reset_index()[candidates.columns]
+
+    logger.info("Merged %s duplicate candidate registrations into %s candidates",
+                len(id_map), len(set(id_map.values())))
+    return merged, id_map
+
+def remap_candidate_ids(df, id_map):
+    """Point CandidateID references at the surviving candidate"""
+    if not id_map or df.empty or 'CandidateID' not in df.columns:
+        return df
+    df = df.copy()
+    # A single hash lookup per row; Series.replace scans the column once per mapped ID
+    df['CandidateID'] = df['CandidateID'].map(id_map).fillna(df['CandidateID'])
+    return df
@@ -0,0 +1,128 @@
+import logging
+import os
+import pandas as pd
+from utils.helpers import get_data_path, ensure_directory_exists
+
+logger = logging.getLogger(__name__)
+
+# Entity name -> natural key column; the surrogate column swaps "ID" for "Key"
+KEY_ENTITIES = {
+    'candidate': 'CandidateID',
+    'cohort': 'CohortID',
+    'team': 'TeamID',
+    'province': 'ProvinceID',
+}
+
+KEY_DTYPE = 'Int32'
+
+# Reserved for rows whose natural key is missing; registries assign keys from 1
+UNKNOWN_KEY = 0
+
+def surrogate_column(natural_column):
+    """CandidateID -> CandidateKey"""
+    return natural_column[:-2] + 'Key'
+
+KEY_COLUMNS = [surrogate_column(column) for column in KEY_ENTITIES.values()]
+
+class KeyRegistry:
+    """
+    Stable natural key -> integer surrogate key mapping for one entity.
+
+    Keys are assigned in first-seen order starting at 1 and never reused, so
+    a natural key keeps its surrogate across runs as long as the mapping
+    file is kept.
+    """
+
+    def __init__(self, entity, path):
+        self.entity = entity
+        self.path = path
+        self._index = pd.Index([], dtype=object)
+        self._dirty = False
+
+        if path.exists():
+            mapping = pd.read_csv(path, dtype={'natural_key': str}, keep_default_na=False)
+            mapping = mapping.sort_values('surrogate_key')
+            if not (mapping['surrogate_key'].values == range(1, len(mapping) + 1)).all():
+                raise ValueError(f"Key mapping {path} is not contiguous, refusing to reuse it")
+            self._index = pd.Index(mapping['natural_key'], dtype=object)
+
+    def __len__(self):
+        return len(self._index)
+
+    def encode(self, values):
+        """
+        Return the surrogate keys for a Series of natural keys, registering
+        unseen ones. Missing or blank natural keys get <NA>.
+        """
+        natural = values.astype(str).str.strip()
+        # Blank natural keys are missing keys, not a key of their own
+        natural = natural.where(values.notna() & (natural != ''))
+
+        known = self._index.get_indexer(natural)
+        unseen = natural[(known == -1) & natural.notna()].unique()
+        if len(unseen):
+            self._index = self._index.append(pd.Index(unseen, dtype=object))
+            self._dirty = True
+            known = self._index.get_indexer(natural)
+
+        keys = pd.Series(known + 1, index=values.index).astype(KEY_DTYPE)
+        return keys.where(natural.notna())
+
+    def save(self):
+        """Write the mapping atomically if it changed"""
+        if not self._dirty:
+            return
+
+        ensure_directory_exists(self.path.parent)
+        mapping = pd.DataFrame({
+            'surrogate_key': range(1, len(self._index) + 1),
+            'natural_key': self._index,
+        })
+        tmp_path = self.path.with_suffix('.tmp')
+        mapping.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+def load_registries(key_dir=None):
+    """Natural key column -> KeyRegistry, read from key_dir (default data/keys/)"""
+    key_dir = key_dir or get_data_path("keys")
+    return {
+        natural_column: KeyRegistry(entity, key_dir / f"{entity}_keys.csv")
+        for entity, natural_column in KEY_ENTITIES.items()
+    }
+
+def save_registries(registries, registered_before):
+    """Persist the registries; registered_before maps each column to its registry size before encoding"""
+    for natural_column, registry in registries.items():
+        registry.save()
+        new_keys = len(registry) - registered_before[natural_column]
+        if new_keys:
+            logger.info("Registered %s new %s keys (%s total)", new_keys, registry.entity, len(registry))
+
+def encode_keys(cleaned_data, key_dir=None):
+    """
+    Add integer surrogate key columns next to every natural key column
+    (CandidateID -> CandidateKey, CohortID -> CohortKey, ...) in all datasets.
+
+    Mappings are persisted under data/keys/ so keys stay stable between runs.
+    Key columns that are already present are left as they are, so encoded
+    data can be passed through again.
+    """
+    registries = load_registries(key_dir)
+    registered_before = {column: len(registry) for column, registry in registries.items()}
+
+    encoded_data = {}
+    for name, df in cleaned_data.items():
+        natural_columns = [
+            c for c in registries
+            if isinstance(df, pd.DataFrame) and c in df.columns and surrogate_column(c) not in df.columns
+        ]
+        if natural_columns:
+            # One copy per dataset, however many key columns it gets
+            df = df.copy()
+            for natural_column in natural_columns:
+                df[surrogate_column(natural_column)] = registries[natural_column].encode(df[natural_column])
+        encoded_data[name] = df
+
+    save_registries(registries, registered_before)
+    return encoded_data
@@ -1,9 +1,13 @@
 import logging
 import pandas as pd
-import json
+from transform.data_transformer import AGE_GROUP_BINS, AGE_GROUP_LABELS
 
 logger = logging.getLogger(__name__)
 
+# Case-insensitive whole-status match on PlacementStatus, shared with the rollup
+# cubes; 'Not Placed' and 'Unemployed' are not successful placements
+SUCCESSFUL_PLACEMENT_PATTERN = r'^\s*(?:placed|employed)\s*$'
+
 def create_summary_reports(transformed_data):
     """
     Create summary reports for stakeholders
@@ -25,7 +29,7 @@ def create_summary_reports(transformed_data):
         placement_data = transformed_data['placement_analysis']
         total_placements = len(placement_data)
         successful_placements = len(placement_data[
-            placement_data['PlacementStatus'].str.contains('Placed|Employed', case=False, na=False)
+            placement_data['PlacementStatus'].str.contains(SUCCESSFUL_PLACEMENT_PATTERN, case=False, na=False)
         ])
         program_summary['placement_rate'] = (successful_placements / total_placements * 100) if total_placements > 0 else 0
         program_summary['total_placements'] = total_placements
@@ -45,7 +49,7 @@ def create_summary_reports(transformed_data):
         
         placement_analytics['by_gender'] = placement_data.groupby('Gender')['PlacementStatus'].value_counts().unstack(fill_value=0)
         placement_analytics['by_age_group'] = placement_data.groupby(
-            pd.cut(placement_data['Age'], bins=[0, 25, 30, 35, 50], labels=['18-25', '26-30', '31-35', '36+'])
+            pd.cut(placement_data['Age'], bins=AGE_GROUP_BINS, labels=AGE_GROUP_LABELS)
         )['PlacementStatus'].value_counts().unstack(fill_value=0)
         
         if 'ProvinceID' in placement_data:
@@ -67,5 +71,5 @@ def create_summary_reports(transformed_data):
     if 'team_performance' in transformed_data:
         reports['team_analytics'] = transformed_data['team_performance']
     
-    logger.info(f"Created {len(reports)} summary reports")
+    logger.info("Created %s summary reports", len(reports))
     return reports
\ No newline at end of file
@@ -0,0 +1,189 @@
+import json
+import logging
+import pandas as pd
+from utils.helpers import get_data_path, ensure_directory_exists
+from transform.key_encoder import KEY_DTYPE, UNKNOWN_KEY
+from transform.report_generator import SUCCESSFUL_PLACEMENT_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# Bump when dimensions or measures change so cached partitions are rebuilt
+ROLLUP_VERSION = 5
+
+KEY_DIMENSIONS = ['CohortKey', 'ProvinceKey']
+LABEL_DIMENSIONS = ['Gender', 'AgeGroup']
+ROLLUP_DIMENSIONS = KEY_DIMENSIONS + LABEL_DIMENSIONS
+UNKNOWN_MEMBER = 'Unknown'
+
+PLACEMENT_MEASURES = ['total_candidates', 'placed_candidates', 'total_placements']
+COMPLETION_MEASURES = ['total_candidates', 'candidates_with_courses', 'course_enrollments', 'course_completions']
+
+COMPLETED_COURSE_PATTERN = r'^\s*completed\s*$'
+
+# Datasets build_rollups adds; they are loaded to the warehouse, not saved as CSV outputs
+ROLLUP_NAMES = ['placement_cube', 'completion_cube']
+
+def _partition_fingerprints(candidates, placements, coursera):
+    """
+    Fingerprint the inputs of every cohort so unchanged cohorts can reuse
+    their previously computed cube rows
+    """
+    per_source = {}
+    for name, df in [('candidates', candidates), ('placements', placements), ('coursera', coursera)]:
+        if df.empty:
+            continue
+        row_hashes = pd.util.hash_pandas_object(df.drop(columns='CohortKey'), index=False)
+        # Summing row hashes makes the fingerprint independent of row order
+        per_source[name] = row_hashes.groupby(df['CohortKey'].values).sum()
+
+    if not per_source:
+        return {}
+
+    combined = pd.DataFrame(per_source).fillna(0).astype('uint64')
+    cohort_hashes = pd.util.hash_pandas_object(combined, index=True)
+    return {int(cohort): str(h) for cohort, h in cohort_hashes.items()}
+
+def _candidate_measures(candidates, placements, coursera):
+    """One row per candidate with the cube dimensions and additive per-candidate measures"""
+    measures = candidates[['CandidateKey'] + ROLLUP_DIMENSIONS].copy()
+
+    if not placements.empty:
+        successful = placements['PlacementStatus'].astype(str).str.contains(
+            SUCCESSFUL_PLACEMENT_PATTERN, case=False, regex=True
+        )
+        per_candidate = placements.assign(is_placed=successful).groupby('CandidateKey').agg(
+            total_placements=('CandidateKey', 'size'),
+            placed_candidates=('is_placed', 'any'),
+        )
+        measures = measures.merge(per_candidate, on='CandidateKey', how='left')
+    else:
+        measures['total_placements'] = 0
+        measures['placed_candidates'] = False
+
+    if not coursera.empty:
+        completed = coursera['Status'].astype(str).str.contains(
+            COMPLETED_COURSE_PATTERN, case=False, regex=True
+        ) if 'Status' in coursera.columns else False
+        per_candidate = coursera.assign(is_completed=completed).groupby('CandidateKey').agg(
+            course_enrollments=('CandidateKey', 'size'),
+            course_completions=('is_completed', 'sum'),
+        )
+        measures = measures.merge(per_candidate, on='CandidateKey', how='left')
+    else:
+        measures['course_enrollments'] = 0
+        measures['course_completions'] = 0
+
+    measures = measures.fillna({
+        'total_placements': 0, 'placed_candidates': False,
+        'course_enrollments': 0, 'course_completions': 0,
+    })
+    measures['total_candidates'] = 1
+    measures['placed_candidates'] = measures['placed_candidates'].astype(bool).astype(int)
+    measures['candidates_with_courses'] = (measures['course_enrollments'] > 0).astype(int)
+    return measures
+
+def _aggregate(measures, columns):
+    """Sum per-candidate measures up to the cube grain"""
+    cube = measures.groupby(ROLLUP_DIMENSIONS, as_index=False)[columns].sum()
+    cube[columns] = cube[columns].astype('int64')
+    return cube
+
+def _prepare_inputs(transformed_data):
+    """Project the transformed datasets onto the columns the cubes need"""
+    candidates = transformed_data['enhanced_candidates'][['CandidateKey'] + ROLLUP_DIMENSIONS].copy()
+    for col in LABEL_DIMENSIONS:
+        candidates[col] = candidates[col].astype(object).where(candidates[col].notna(), UNKNOWN_MEMBER).astype(str)
+    # groupby drops missing keys, so they roll up under the reserved unknown key instead
+    for col in KEY_DIMENSIONS:
+        candidates[col] = candidates[col].fillna(UNKNOWN_KEY)
+
+    cohort_lookup = candidates.set_index('CandidateKey')['CohortKey']
+
+    placements = pd.DataFrame(columns=['CandidateKey', 'PlacementStatus', 'CohortKey'])
+    if 'placement_analysis' in transformed_data:
+        placements = transformed_data['placement_analysis'][['CandidateKey', 'PlacementStatus']].copy()
+        placements['CohortKey'] = placements['CandidateKey'].map(cohort_lookup)
+        # Same semantics as the warehouse views: facts without a known candidate are ignored
+        placements = placements.dropna(subset=['CohortKey'])
+
+    coursera = pd.DataFrame(columns=['CandidateKey', 'Status', 'CohortKey'])
+    if 'coursera_analysis' in transformed_data:
+        coursera_cols = [c for c in ['CandidateKey', 'Status'] if c in transformed_data['coursera_analysis'].columns]
+        coursera = transformed_data['coursera_analysis'][coursera_cols].copy()
+        coursera['CohortKey'] = coursera['CandidateKey'].map(cohort_lookup)
+        coursera = coursera.dropna(subset=['CohortKey'])
+
+    return candidates, placements, coursera
+
+def _load_cache(cache_dir):
+    """Return (partition fingerprints, cached cubes) from the previous run, if compatible"""
+    state_file = cache_dir / "rollup_state.json"
+    if not state_file.exists():
+        return {}, {}
+
+    try:
+        with open(state_file) as f:
+            state = json.load(f)
+        if state.get('version') != ROLLUP_VERSION:
+            logger.info("Rollup cache version changed, rebuilding all partitions")
+            return {}, {}
+
+        cubes = {}
+        for name in ROLLUP_NAMES:
+            dtypes = {**{col: KEY_DTYPE for col in KEY_DIMENSIONS}, **{col: str for col in LABEL_DIMENSIONS}}
+            cubes[name] = pd.read_csv(cache_dir / f"{name}.csv", dtype=dtypes, keep_default_na=False)
+        partitions = {int(cohort): h for cohort, h in state.get('partitions', {}).items()}
+        return partitions, cubes
+    except Exception as e:
+        logger.warning("Could not read rollup cache, rebuilding all partitions: %s", e)
+        return {}, {}
+
+def _save_cache(cache_dir, fingerprints, cubes):
+    """Persist the cubes and partition fingerprints for the next incremental run"""
+    ensure_directory_exists(cache_dir)
+    for name, cube in cubes.items():
+        cube.to_csv(cache_dir / f"{name}.csv", index=False)
+    with open(cache_dir / "rollup_state.json", 'w') as f:
+        partitions = {str(cohort): h for cohort, h in fingerprints.items()}
+        json.dump({'version': ROLLUP_VERSION, 'partitions': partitions}, f, indent=2)
+
+def build_rollups(transformed_data, cache_dir=None, incremental=True):
+    """
+    Build the placement and completion cubes at
+    cohort x province x gender x age group grain.
+
+    Cubes are partitioned by cohort; only cohorts whose inputs changed since
+    the previous run are recomputed, the rest are reused from the cache.
+    """
+    if 'enhanced_candidates' not in transformed_data:
+        logger.warning("No enhanced candidates available, skipping rollups")
+        return {}
+
+    cache_dir = cache_dir or get_data_path("rollups")
+    candidates, placements, coursera = _prepare_inputs(transformed_data)
+
+    fingerprints = _partition_fingerprints(candidates, placements, coursera)
+    previous, cached_cubes = _load_cache(cache_dir) if incremental else ({}, {})
+
+    changed = {cohort for cohort, h in fingerprints.items() if previous.get(cohort) != h}
+    reused = set(fingerprints) - changed
+    if len(cached_cubes) < 2:
+        changed, reused = set(fingerprints), set()
+
+    measures = _candidate_measures(
+        candidates[candidates['CohortKey'].isin(changed)],
+        placements[placements['CohortKey'].isin(changed)],
+        coursera[coursera['CohortKey'].isin(changed)],
+    )
+
+    cubes = {}
+    for name, columns in zip(ROLLUP_NAMES, [PLACEMENT_MEASURES, COMPLETION_MEASURES]):
+        fresh = _aggregate(measures, columns)
+        if reused:
+            kept = cached_cubes[name][cached_cubes[name]['CohortKey'].isin(reused)]
+            fresh = pd.concat([kept, fresh], ignore_index=True)
+        cubes[name] = fresh.sort_values(ROLLUP_DIMENSIONS).reset_index(drop=True)
+
+    _save_cache(cache_dir, fingerprints, cubes)
+    logger.info("Rollups built: %s cohorts recomputed, %s reused from cache", len(changed), len(reused))
+    return cubes
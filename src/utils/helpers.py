@@ -1,4 +1,3 @@
-import yaml
 import os
 from pathlib import Path
 
@@ -26,4 +25,16 @@ def get_db_connection_string():
     port = os.getenv("POSTGRES_PORT", "5432")
     db_name = os.getenv("POSTGRES_DB", "youth_employment")
     
-    return f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{db_name}"
\ No newline at end of file
+    return f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{db_name}"
+
+EXECUTION_BACKENDS = ("pandas", "duckdb")
+
+def get_execution_backend():
+    """
+    Engine the ETL runs its transform and report stages on, from ETL_BACKEND:
+    "pandas" (default) or "duckdb" for inputs larger than memory
+    """
+    backend = os.getenv("ETL_BACKEND", "pandas").strip().lower()
+    if backend not in EXECUTION_BACKENDS:
+        raise ValueError(f"Unknown ETL_BACKEND {backend!r}, expected one of {', '.join(EXECUTION_BACKENDS)}")
+    return backend
\ No newline at end of file
@@ -0,0 +1,146 @@
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from utils.helpers import get_project_root, ensure_directory_exists
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL_SECONDS = 5.0
+MAX_BATCH_SIZE = 1000
+
+_STOP = object()
+
+class MetricsSink:
+    """
+    Collects counters and timers from the pipeline threads and writes them
+    to a JSON-lines file in batches from a background thread.
+
+    Recording a metric only puts a tuple on a queue; aggregation and file
+    I/O happen on the writer thread, so it is cheap enough for hot paths.
+    """
+
+    def __init__(self, path, flush_interval=FLUSH_INTERVAL_SECONDS, max_batch_size=MAX_BATCH_SIZE):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+
+    def start(self):
+        """Start the background writer thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="metrics-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Flush everything recorded so far and stop the writer thread"""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def increment(self, name, value=1, **tags):
+        """Add value to a counter"""
+        self._queue.put(('counter', name, value, tags))
+
+    def record_time(self, name, seconds, **tags):
+        """Record one timing sample in seconds"""
+        self._queue.put(('timer', name, seconds, tags))
+
+    @contextmanager
+    def timer(self, name, **tags):
+        """Time the enclosed block and record it under name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_time(name, time.perf_counter() - start, **tags)
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._flush(batch)
+                return
+            if item is not None:
+                batch.append(item)
+
+            if len(batch) >= self.max_batch_size or time.monotonic() >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self, batch):
+        """Aggregate a batch per (type, name, tags) and append it to the metrics file"""
+        if not batch:
+            return
+
+        aggregates = {}
+        for kind, name, value, tags in batch:
+            key = (kind, name, tuple(sorted(tags.items())))
+            if key not in aggregates:
+                aggregates[key] = {'count': 0, 'total': 0, 'max': None}
+            agg = aggregates[key]
+            agg['count'] += 1
+            agg['total'] += value
+            agg['max'] = value if agg['max'] is None else max(agg['max'], value)
+
+        timestamp = datetime.now(timezone.utc).isoformat()
+        lines = []
+        for (kind, name, tags), agg in aggregates.items():
+            entry = {'timestamp': timestamp, 'type': kind, 'name': name, 'tags': dict(tags)}
+            if kind == 'counter':
+                entry['value'] = agg['total']
+            else:
+                entry.update(count=agg['count'], total_seconds=agg['total'], max_seconds=agg['max'])
+            lines.append(json.dumps(entry, default=str))
+
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+        except OSError as e:
+            logger.warning("Could not write metrics to %s: %s", self.path, e)
+
+class NullMetrics:
+    """Drop-in stand-in used when no metrics sink has been set up"""
+
+    def increment(self, name, value=1, **tags):
+        pass
+
+    def record_time(self, name, seconds, **tags):
+        pass
+
+    @contextmanager
+    def timer(self, name, **tags):
+        yield
+
+_sink = NullMetrics()
+
+def setup_metrics():
+    """Start the process-wide metrics sink writing to logs/metrics.jsonl (only the first call has any effect)"""
+    global _sink
+    if isinstance(_sink, MetricsSink):
+        return _sink
+
+    log_dir = get_project_root() / "logs"
+    ensure_directory_exists(log_dir)
+
+    _sink = MetricsSink(log_dir / "metrics.jsonl")
+    _sink.start()
+    atexit.register(_sink.stop)
+    return _sink
+
+def get_metrics():
+    """Return the active metrics sink, or a no-op one if metrics are not set up"""
+    return _sink
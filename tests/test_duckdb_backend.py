@@ -0,0 +1,88 @@
+import shutil
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from extract.csv_extractor import extract_data
+from transform import duckdb_backend
+from transform.data_cleaner import clean_data
+from transform.data_transformer import transform_data
+from transform.report_generator import create_summary_reports
+from utils.helpers import get_data_path, get_execution_backend
+
+# Rows appended to the sample CSVs to exercise the cleaning rules
+MESSY_ROWS = {
+    'Candidate.csv': [
+        # Re-registration of CAN001, merged by entity resolution
+        'CAN200,Thabo,Mthembu,Male,24,thabo.mthembu@email.com,+27823456789,TM001,COH001,PROV001,BR001,2025-03-01',
+        # Missing age and gender, unknown cohort
+        'CAN201,Lindiwe,Sithole,,,lindiwe.sithole@email.com,0821239876,TM002,COH999,PROV002,BR002,2025-02-01',
+        # Duplicate CandidateID
+        'CAN002,Someone,Else,Female,30,someone@email.com,0830000000,TM001,COH001,PROV001,BR001,2025-01-15',
+    ],
+    'Placement.csv': [
+        'PLAC900,CAN200,Employed,Acme,Analyst,2025-08-01,Placed under the later registration',
+        'PLAC001,CAN003,Placed,Duplicate Corp,Developer,2025-07-01,Duplicate PlacementID',
+        'PLAC901,CAN004,Placed,,Developer,2025-07-01,Missing company',
+        'PLAC902,CAN005,Placed,Acme,Developer,soon,Unparseable start date',
+        'PLAC903,CAN999,Placed,Acme,Developer,2025-07-01,Unknown candidate',
+        'PLAC904,CAN201,Not Placed,Acme,Developer,2025-07-01,Not a successful placement',
+    ],
+    'Coursera.csv': [
+        'PROG900,CAN200,Course Under The Later Registration,100,2025-03-15,Completed',
+        'PROG901,CAN201,Another Course,40,not a date,In Progress',
+        'PROG001,CAN002,Duplicate ProgressID,100,2025-02-15,Completed',
+    ],
+    'Scrum.csv': ['SCR001,TM002,2025-01-22,25,Someone,Duplicate ScrumID,Duplicate'],
+    'Project.csv': ['PROJ001,TM002,Duplicate ProjectID,2025-02-28,7.0,Duplicate'],
+}
+
+@pytest.fixture(params=['sample', 'messy'])
+def raw_dir(request, tmp_path):
+    raw_dir = tmp_path / "raw"
+    shutil.copytree(get_data_path("raw"), raw_dir)
+    if request.param == 'messy':
+        for filename, rows in MESSY_ROWS.items():
+            with open(raw_dir / filename, 'a', encoding='utf-8') as f:
+                f.write(''.join(f"\n{row}" for row in rows))
+    return raw_dir
+
+def _assert_same(expected, actual):
+    if isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(actual, expected)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(actual, expected)
+    elif isinstance(expected, dict):
+        assert actual.keys() == expected.keys()
+        for name in expected:
+            _assert_same(expected[name], actual[name])
+    else:
+        assert actual == expected
+
+def test_duckdb_backend_matches_pandas(raw_dir, tmp_path):
+    transformed = transform_data(clean_data(extract_data(raw_dir)), key_dir=tmp_path / "pandas_keys")
+    reports = create_summary_reports(transformed)
+
+    with duckdb_backend.connect() as con:
+        duckdb_transformed = duckdb_backend.transform_data(con, raw_dir=raw_dir, key_dir=tmp_path / "duckdb_keys")
+        duckdb_reports = duckdb_backend.create_summary_reports(con)
+
+    _assert_same(transformed, duckdb_transformed)
+    _assert_same(reports, duckdb_reports)
+
+    # Both backends register the natural keys in the same order
+    for mapping in (tmp_path / "pandas_keys").iterdir():
+        assert (tmp_path / "duckdb_keys" / mapping.name).read_text() == mapping.read_text()
+
+    if raw_dir.joinpath('Candidate.csv').read_text().count('CAN200'):
+        # The re-registration was merged and its placement moved to the surviving candidate
+        assert 'CAN200' not in set(duckdb_transformed['enhanced_candidates']['CandidateID'])
+        placements = duckdb_transformed['placement_analysis'].set_index('PlacementID')
+        assert placements.loc['PLAC900', 'CandidateID'] == 'CAN001'
+
+def test_unknown_backend_is_rejected(monkeypatch):
+    monkeypatch.setenv("ETL_BACKEND", "spark")
+    with pytest.raises(ValueError, match="ETL_BACKEND"):
+        get_execution_backend()
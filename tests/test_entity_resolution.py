@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+from transform.entity_resolution import remap_candidate_ids, resolve_candidates
+
+def candidate(candidate_id, first, last, phone, email, gender='Female', age=24, enrolled='2024-01-15'):
+    return {'CandidateID': candidate_id, 'FirstName': first, 'LastName': last, 'Gender': gender, 'Age': age,
+            'PhoneNumber': phone, 'Email': email, 'EnrollmentDate': enrolled}
+
+def resolve(*rows):
+    return resolve_candidates(pd.DataFrame(list(rows)))
+
+def test_reregistration_with_small_changes_is_merged():
+    merged, id_map = resolve(
+        candidate('CAN001', 'Lerato', 'Mokoena', '082 555 1234', 'lerato.mokoena@gmail.com'),
+        # Later registration: name typo, one phone digit off, email typo, +27 prefix
+        candidate('CAN002', 'Lerato', 'Mokoeno', '+27 82 555 1284', 'lerato.mokoenna@gmail.com',
+                  age=25, enrolled='2025-02-01'),
+    )
+    assert id_map == {'CAN002': 'CAN001'}
+    assert merged['CandidateID'].tolist() == ['CAN001']
+
+def test_exact_phone_and_name_is_merged():
+    _, id_map = resolve(
+        candidate('CAN001', 'Thabo', 'Nkosi', '0712345678', 'thabo.n@yahoo.com', gender='Male'),
+        candidate('CAN002', 'Thabo', 'Nkosi', '712345678', '', gender='Male', enrolled='2025-01-01'),
+    )
+    assert id_map == {'CAN002': 'CAN001'}
+
+def test_shared_household_phone_is_not_merged():
+    _, id_map = resolve(
+        candidate('CAN001', 'Naledi', 'Dlamini', '0821112222', 'naledi.dlamini@gmail.com'),
+        candidate('CAN002', 'Zanele', 'Dlamini', '0821112222', 'zanele.dlamini@gmail.com'),
+    )
+    assert id_map == {}
+
+def test_similar_names_on_sequential_phone_numbers_are_not_merged():
+    # As in data/raw: two candidates whose numbers differ only in the last two digits
+    _, id_map = resolve(
+        candidate('CAN010', 'Nomhle', 'Mthethwa', '812345678', 'nomhle.mthethwa@email.com', age=31),
+        candidate('CAN060', 'Nobuhle', 'Mthethwa', '812345683', 'nobuhle.mthethwa@email.com', age=30),
+    )
+    assert id_map == {}
+
+def test_same_name_with_different_contacts_is_not_merged():
+    _, id_map = resolve(
+        candidate('CAN001', 'Sipho', 'Zulu', '0831234567', 'sipho.zulu@gmail.com', gender='Male'),
+        candidate('CAN002', 'Sipho', 'Zulu', '0769876543', 'szulu88@outlook.com', gender='Male'),
+    )
+    assert id_map == {}
+
+def test_conflicting_gender_vetoes_a_match():
+    _, id_map = resolve(
+        candidate('CAN001', 'Lerato', 'Mokoena', '0825551234', 'lerato.mokoena@gmail.com'),
+        candidate('CAN002', 'Lerato', 'Mokoena', '0825551234', 'lerato.mokoena@gmail.com', gender='Male'),
+    )
+    assert id_map == {}
+
+def test_vetoes_hold_across_a_cluster():
+    # B (gender unknown) matches both A and C, but A and C must not end up together
+    _, id_map = resolve(
+        candidate('CAN001', 'Ayanda', 'Zwane', '0825551234', 'ayanda.zwane@gmail.com', gender='Female'),
+        candidate('CAN002', 'Ayanda', 'Zwane', '0825551234', 'ayanda.zwane@gmail.com', gender='', enrolled='2024-06-01'),
+        candidate('CAN003', 'Ayanda', 'Zwane', '0825551234', 'ayanda.zwane@gmail.com', gender='Male', enrolled='2025-01-01'),
+    )
+    survivor = lambda candidate_id: id_map.get(candidate_id, candidate_id)
+    assert survivor('CAN001') != survivor('CAN003')
+    assert len(id_map) == 1
+
+def test_age_veto_holds_across_a_cluster():
+    # 20 - 22 and 22 - 24 are each within MAX_AGE_DIFFERENCE, 20 - 24 is not
+    _, id_map = resolve(*[
+        candidate(f'CAN00{i}', 'Lerato', 'Mokoena', '0825551234', 'lerato.mokoena@gmail.com', age=age,
+                  enrolled=f'202{i}-01-15')
+        for i, age in enumerate([20, 22, 24], start=1)
+    ])
+    survivor = lambda candidate_id: id_map.get(candidate_id, candidate_id)
+    assert survivor('CAN001') != survivor('CAN003')
+    assert len(id_map) == 1
+
+def test_remap_candidate_ids():
+    df = pd.DataFrame({'CandidateID': ['CAN001', 'CAN002', 'CAN003'], 'Status': ['Placed', 'Placed', 'Pending']})
+    remapped = remap_candidate_ids(df, {'CAN002': 'CAN001'})
+    assert remapped['CandidateID'].tolist() == ['CAN001', 'CAN001', 'CAN003']
+    assert df['CandidateID'].tolist() == ['CAN001', 'CAN002', 'CAN003']
+
+FIRST_NAMES = ['thabo', 'sipho', 'lerato', 'naledi', 'zanele', 'mandla', 'palesa', 'tshepo', 'annika', 'david']
+LAST_NAMES = ['mokoena', 'nkosi', 'dlamini', 'khumalo', 'ndlovu', 'zulu', 'naidoo', 'botha', 'smith', 'radebe']
+
+def _typo(text, rng):
+    i = rng.integers(0, len(text))
+    return text[:i] + 'abcdefghijklmnopqrstuvwxyz'[rng.integers(0, 26)] + text[i + 1:]
+
+def test_planted_duplicates_at_scale():
+    """Duplicates with a name typo, a wrong phone digit and an email typo are all found, and nothing else"""
+    rng = np.random.default_rng(0)
+    n, n_duplicates = 20_000, 500
+    first, last = rng.choice(FIRST_NAMES, n), rng.choice(LAST_NAMES, n)
+    candidates = pd.DataFrame({
+        'CandidateID': [f"CAN{i:06d}" for i in range(n)],
+        'FirstName': first,
+        'LastName': last,
+        'Gender': rng.choice(['Male', 'Female'], n),
+        'Age': rng.integers(18, 36, n),
+        'PhoneNumber': ['08' + ''.join(map(str, digits)) for digits in rng.integers(0, 10, (n, 8))],
+        'Email': [f"{f}.{l}{k}@gmail.com" for f, l, k in zip(first, last, rng.permutation(10 * n)[:n])],
+        'EnrollmentDate': '2024-01-15',
+    }).astype(object)
+
+    originals = rng.choice(n, n_duplicates, replace=False)
+    duplicates = candidates.iloc[originals].copy()
+    duplicates['CandidateID'] = [f"DUP{i:06d}" for i in range(n_duplicates)]
+    duplicates['EnrollmentDate'] = '2025-01-15'
+    duplicates['LastName'] = [_typo(name, rng) for name in duplicates['LastName']]
+    duplicates['PhoneNumber'] = [p[:5] + str((int(p[5]) + 1) % 10) + p[6:] for p in duplicates['PhoneNumber']]
+    duplicates['Email'] = [_typo(e.split('@')[0], rng) + '@gmail.com' for e in duplicates['Email']]
+
+    merged, id_map = resolve_candidates(pd.concat([candidates, duplicates], ignore_index=True))
+    assert id_map == dict(zip(duplicates['CandidateID'], candidates['CandidateID'].iloc[originals]))
+    assert len(merged) == n
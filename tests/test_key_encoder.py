@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from transform.key_encoder import UNKNOWN_KEY, KeyRegistry, encode_keys
+
+def test_keys_are_stable_across_a_reload(tmp_path):
+    path = tmp_path / "candidate_keys.csv"
+    registry = KeyRegistry('candidate', path)
+    assert registry.encode(pd.Series(['CAN001', 'CAN002'])).tolist() == [1, 2]
+    registry.save()
+
+    reloaded = KeyRegistry('candidate', path)
+    assert reloaded.encode(pd.Series(['CAN002', 'CAN003', ' CAN001 '])).tolist() == [2, 3, 1]
+    reloaded.save()
+    assert KeyRegistry('candidate', path).encode(pd.Series(['CAN003'])).tolist() == [3]
+
+def test_blank_natural_keys_get_no_key(tmp_path):
+    registry = KeyRegistry('cohort', tmp_path / "cohort_keys.csv")
+    keys = registry.encode(pd.Series(['COH001', None, np.nan, '', '   ']))
+
+    assert keys.iloc[0] == 1
+    assert keys.iloc[1:].isna().all()
+    assert len(registry) == 1
+    # UNKNOWN_KEY is reserved for these rows and never handed out
+    assert UNKNOWN_KEY not in keys.dropna().tolist()
+
+def test_encode_keys_persists_the_mapping(tmp_path):
+    first = encode_keys({'cohorts': pd.DataFrame({'CohortID': ['COH001', 'COH002']})}, key_dir=tmp_path)
+    second = encode_keys({
+        'candidates': pd.DataFrame({'CandidateID': ['CAN001', 'CAN002'], 'CohortID': ['COH002', '']}),
+    }, key_dir=tmp_path)
+
+    assert first['cohorts']['CohortKey'].tolist() == [1, 2]
+    assert second['candidates']['CohortKey'].iloc[0] == 2
+    assert pd.isna(second['candidates']['CohortKey'].iloc[1])
@@ -0,0 +1,55 @@
+import json
+
+import pandas as pd
+import pytest
+
+from load.output_writer import MANIFEST_FILE, OutputWriter
+
+FRAME = pd.DataFrame({'TeamID': ['TM001', 'TM002'], 'TotalScrums': [4, 7]})
+
+def write(output_path, df=FRAME):
+    writer = OutputWriter(output_path)
+    writer.add_csv("team_performance.csv", df, index=False)
+    writer.add_json("program_summary.json", {'total_candidates': 2})
+    return writer.write_all()
+
+def test_unchanged_outputs_are_skipped(tmp_path):
+    assert sorted(write(tmp_path)) == ["program_summary.json", "team_performance.csv"]
+    mtime = (tmp_path / "team_performance.csv").stat().st_mtime_ns
+
+    assert write(tmp_path) == []
+    assert (tmp_path / "team_performance.csv").stat().st_mtime_ns == mtime
+    assert write(tmp_path, FRAME.assign(TotalScrums=[4, 8])) == ["team_performance.csv"]
+
+def test_file_changed_on_disk_is_rewritten(tmp_path):
+    write(tmp_path)
+    (tmp_path / "team_performance.csv").write_text("garbage")
+
+    assert write(tmp_path) == ["team_performance.csv"]
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "team_performance.csv"), FRAME, check_dtype=False)
+
+def test_deleted_file_is_rewritten(tmp_path):
+    write(tmp_path)
+    (tmp_path / "program_summary.json").unlink()
+
+    assert write(tmp_path) == ["program_summary.json"]
+
+def test_failed_write_keeps_the_previous_file(tmp_path, monkeypatch):
+    write(tmp_path)
+    previous = (tmp_path / "team_performance.csv").read_text()
+
+    def fail_halfway(self, path, df, index):
+        path.write_text("TeamID,Tot")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(OutputWriter, "_write_csv", fail_halfway)
+    with pytest.raises(OSError, match="disk full"):
+        write(tmp_path, FRAME.assign(TotalScrums=[4, 8]))
+
+    assert (tmp_path / "team_performance.csv").read_text() == previous
+    assert sorted(p.name for p in tmp_path.iterdir()) == [MANIFEST_FILE, "program_summary.json", "team_performance.csv"]
+    # The failed output is dropped from the manifest, so the next run writes it again
+    assert "team_performance.csv" not in json.loads((tmp_path / MANIFEST_FILE).read_text())
+
+    monkeypatch.undo()
+    assert write(tmp_path, FRAME.assign(TotalScrums=[4, 8])) == ["team_performance.csv"]
@@ -0,0 +1,56 @@
+import logging
+
+import pandas as pd
+import pytest
+
+from extract.csv_extractor import extract_data
+from transform.data_cleaner import clean_data
+from transform.data_transformer import transform_data
+from transform.rollup_builder import ROLLUP_NAMES, build_rollups
+
+@pytest.fixture(scope="module")
+def transformed(tmp_path_factory):
+    """The sample CSVs in data/raw, transformed as in the DAG"""
+    key_dir = tmp_path_factory.mktemp("keys")
+    return transform_data(clean_data(extract_data()), key_dir=key_dir)
+
+def _edit(transformed):
+    """Change one cohort, move a candidate between two others and delete a fourth"""
+    candidates = transformed['enhanced_candidates'].copy()
+    placements = transformed['placement_analysis']
+    coursera = transformed['coursera_analysis']
+    changed, source, target, deleted = sorted(candidates['CohortKey'].dropna().unique())[:4]
+
+    first_changed = candidates.index[candidates['CohortKey'] == changed][0]
+    candidates.loc[first_changed, 'Gender'] = 'Female' if candidates.loc[first_changed, 'Gender'] == 'Male' else 'Male'
+
+    moved = candidates.index[candidates['CohortKey'] == source][0]
+    candidates.loc[moved, 'CohortKey'] = target
+
+    gone = candidates.loc[candidates['CohortKey'] == deleted, 'CandidateKey']
+    return {
+        'enhanced_candidates': candidates[candidates['CohortKey'] != deleted],
+        'placement_analysis': placements[~placements['CandidateKey'].isin(gone)],
+        'coursera_analysis': coursera[~coursera['CandidateKey'].isin(gone)],
+    }
+
+def test_incremental_rollups_match_a_full_rebuild(transformed, tmp_path, caplog):
+    inputs = {name: transformed[name] for name in ['enhanced_candidates', 'placement_analysis', 'coursera_analysis']}
+    build_rollups(inputs, cache_dir=tmp_path / "cache")
+    edited = _edit(inputs)
+
+    with caplog.at_level(logging.INFO, logger='transform.rollup_builder'):
+        incremental = build_rollups(edited, cache_dir=tmp_path / "cache", incremental=True)
+    full = build_rollups(edited, cache_dir=tmp_path / "fresh", incremental=False)
+
+    for name in ROLLUP_NAMES:
+        pd.testing.assert_frame_equal(incremental[name], full[name])
+
+    # Three cohorts changed (the deleted one has nothing left to recompute); the rest came from the cache
+    recomputed, reused = next(r.args for r in caplog.records if r.getMessage().startswith("Rollups built"))
+    assert recomputed == 3
+    assert reused == edited['enhanced_candidates']['CohortKey'].nunique() - 3
+
+    # The deleted cohort is gone from the cubes, not left behind from the cache
+    deleted = set(inputs['enhanced_candidates']['CohortKey']) - set(edited['enhanced_candidates']['CohortKey'])
+    assert not incremental['placement_cube']['CohortKey'].isin(deleted).any()